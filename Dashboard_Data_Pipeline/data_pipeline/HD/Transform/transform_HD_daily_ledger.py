@@ -76,7 +76,7 @@ def build_monthly_from_ledger():
     # Monthly net cash movement: debits increase cash, credits decrease cash
     monthly_change = (
         df_cash.assign(net=lambda x: x["debit"] - x["credit"])
-               .groupby("month", as_index=False)["net"].sum()
+               .groupby("month", as_index=False, sort=False)["net"].sum()
                .rename(columns={"net": "net_change"})
     )
 
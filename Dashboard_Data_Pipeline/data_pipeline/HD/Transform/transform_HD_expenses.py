@@ -22,6 +22,7 @@
 
 import os
 import json
+import argparse
 import logging
 import pandas as pd
 import sys
@@ -37,6 +38,31 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
+# ============================================
+# COLUMN GROUPS
+# ============================================
+
+# Fragile fields forced to string before writing
+STRING_COLS = ("vatnumber",)
+
+# Low-cardinality fields dictionary-encoded when repeated often enough
+CATEGORICAL_COLS = ("vatnumber", "supplierId", "customId", "currency")
+
+# ============================================
+# CONSOLE OUTPUT
+# ============================================
+
+# Progress echo is off by default (everything is still logged); enable with --verbose.
+# Warnings and errors are always printed.
+VERBOSE = False
+
+def echo(message):
+    """
+    Print a progress message to the console when running with --verbose.
+    """
+    if VERBOSE:
+        print(message)
+
 # ============================================
 # SAVE PARQUET WITH FALLBACK
 # ============================================
@@ -44,20 +70,40 @@ logging.basicConfig(
 def save_parquet(df, path):
     """
     Save DataFrame as Parquet, preferring pyarrow but falling back to fastparquet.
+    The pyarrow path converts and writes with Arrow's multi-threaded C++ writer
+    (zstd compressed) instead of going through pandas' to_parquet wrapper.
     """
     try:
-        df.to_parquet(path, index=False, engine="pyarrow")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     except ImportError:
-        print("pyarrow not found, falling back to fastparquet.")
+        echo("pyarrow not found, falling back to fastparquet.")
         logging.warning("pyarrow not found, falling back to fastparquet.")
         df.to_parquet(path, index=False, engine="fastparquet")
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False, nthreads=os.cpu_count())
+    pq.write_table(table, path, compression="zstd")
+
+# ============================================
+# TYPE SNIFFING
+# ============================================
+
+def first_non_null(values):
+    """
+    Return the first value that is not None/NaN, or None if there is none.
+    """
+    return next(
+        (v for v in values if v is not None and v is not pd.NA and not (isinstance(v, float) and v != v)),
+        None
+    )
 
 # ============================================
 # TRANSFORMATION FUNCTION
 # ============================================
 
 def transform_holded_expenses():
-    print("Starting transform_holded_expenses()")
+    echo("Starting transform_holded_expenses()")
     logging.info("Entered transform_holded_expenses()")
     
     try:
@@ -67,46 +113,69 @@ def transform_holded_expenses():
         os.makedirs(output_dir, exist_ok=True)
 
         # Load raw JSON
-        print(f"Loading raw data from {input_path}")
+        echo(f"Loading raw data from {input_path}")
         with open(input_path, "r", encoding="utf-8") as f:
             raw_data = json.load(f)
 
         records = raw_data["data"] if isinstance(raw_data, dict) and "data" in raw_data else raw_data
         df = pd.json_normalize(records)
 
+        # Release the parsed JSON objects; from here on the DataFrame is the only copy
+        del raw_data, records
+
         if df.empty:
             msg = "Empty Holded expenses data."
             logging.warning(msg)
             print(msg)
             return
 
-        # Detect and stringify list-type columns
-        list_columns = [col for col in df.columns if df[col].apply(lambda x: isinstance(x, list)).any()]
+        # Detect and stringify list-type columns (sniff the first non-null value per column)
+        list_columns = [
+            col for col in df.select_dtypes(include="object").columns
+            if isinstance(first_non_null(df[col].to_numpy()), list)
+        ]
         if list_columns:
             logging.warning(f"List-type columns in Holded expenses: {list_columns}")
             print(f"List-type columns in Holded expenses: {list_columns}")
             for col in list_columns:
-                df[col] = df[col].apply(lambda x: str(x) if isinstance(x, list) else x)
+                df[col] = [str(v) if isinstance(v, list) else v for v in df[col].to_numpy()]
 
         # Force problematic fields to string
-        for col in ["vatnumber"]:
+        for col in STRING_COLS:
             if col in df.columns:
                 df[col] = df[col].astype(str)
 
+        # Dictionary-encode low-cardinality repeated strings (smaller Parquet, faster reads)
+        for col in CATEGORICAL_COLS:
+            if col in df.columns and df[col].nunique() / len(df) < 0.5:
+                df[col] = df[col].astype("category")
+
         # Save to CSV
         csv_path = os.path.join(output_dir, base_filename + ".csv")
-        df.to_csv(csv_path, index=False, encoding="utf-8")
+        df.to_csv(csv_path, index=False, encoding="utf-8", chunksize=50_000)
         logging.info(f"CSV saved to: {csv_path}")
-        print(f"CSV saved to: {csv_path}")
+        echo(f"CSV saved to: {csv_path}")
+
+        # Down-cast numeric columns to the smallest lossless dtype, for the Parquet
+        # copy only: CSV keeps float64, as float32's shortest repr would round it.
+        # (pandas narrows floats within a tolerance, so float32 is only kept
+        # when it round-trips exactly; otherwise money values would lose cents)
+        df_parquet = df.copy(deep=False)
+        for col in df.select_dtypes(include=["float64"]).columns:
+            narrowed = pd.to_numeric(df[col], downcast="float")
+            if narrowed.astype("float64").equals(df[col]):
+                df_parquet[col] = narrowed
+        for col in df.select_dtypes(include=["int64"]).columns:
+            df_parquet[col] = pd.to_numeric(df[col], downcast="integer")
 
         # Save to Parquet (with fallback)
         parquet_path = os.path.join(output_dir, base_filename + ".parquet")
-        save_parquet(df, parquet_path)
+        save_parquet(df_parquet, parquet_path)
         logging.info(f"Parquet saved to: {parquet_path}")
-        print(f"Parquet saved to: {parquet_path}")
+        echo(f"Parquet saved to: {parquet_path}")
 
         logging.info(f"Total cleaned Holded expenses: {len(df)}")
-        print(f"Total cleaned Holded expenses: {len(df)}")
+        echo(f"Total cleaned Holded expenses: {len(df)}")
 
     except Exception as e:
         logging.error(f"Error transforming Holded expenses: {e}", exc_info=True)
@@ -118,4 +187,7 @@ def transform_holded_expenses():
 # ============================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verbose", action="store_true", help="Echo progress messages to the console")
+    VERBOSE = parser.parse_args().verbose
     transform_holded_expenses()
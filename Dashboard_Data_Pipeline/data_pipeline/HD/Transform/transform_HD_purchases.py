@@ -9,6 +9,7 @@
 
 import os
 import json
+import argparse
 import logging
 import pandas as pd
 import sys
@@ -23,6 +24,34 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
+# ============================================
+# COLUMN GROUPS
+# ============================================
+
+# Lower-cased names of Unix-timestamp columns converted to datetimes
+TIMESTAMP_COLS = frozenset({"createdat", "updatedat", "date", "payment_date"})
+
+# Fragile fields forced to string before writing
+STRING_COLS = ("vatnumber", "supplierId", "customId")
+
+# Low-cardinality fields dictionary-encoded when repeated often enough
+CATEGORICAL_COLS = ("vatnumber", "supplierId", "customId", "currency")
+
+# ============================================
+# CONSOLE OUTPUT
+# ============================================
+
+# Progress echo is off by default (everything is still logged); enable with --verbose.
+# Warnings and errors are always printed.
+VERBOSE = False
+
+def echo(message):
+    """
+    Print a progress message to the console when running with --verbose.
+    """
+    if VERBOSE:
+        print(message)
+
 # ============================================
 # SAVE PARQUET WITH FALLBACK
 # ============================================
@@ -30,20 +59,40 @@ logging.basicConfig(
 def save_parquet(df, path):
     """
     Save DataFrame as Parquet, preferring pyarrow but falling back to fastparquet.
+    The pyarrow path converts and writes with Arrow's multi-threaded C++ writer
+    (zstd compressed) instead of going through pandas' to_parquet wrapper.
     """
     try:
-        df.to_parquet(path, index=False, engine="pyarrow")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     except ImportError:
-        print("pyarrow not found, falling back to fastparquet.")
+        echo("pyarrow not found, falling back to fastparquet.")
         logging.warning("pyarrow not found, falling back to fastparquet.")
         df.to_parquet(path, index=False, engine="fastparquet")
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False, nthreads=os.cpu_count())
+    pq.write_table(table, path, compression="zstd")
+
+# ============================================
+# TYPE SNIFFING
+# ============================================
+
+def first_non_null(values):
+    """
+    Return the first value that is not None/NaN, or None if there is none.
+    """
+    return next(
+        (v for v in values if v is not None and v is not pd.NA and not (isinstance(v, float) and v != v)),
+        None
+    )
 
 # ============================================
 # TRANSFORMATION FUNCTION
 # ============================================
 
 def transform_holded_purchases():
-    print("Starting transform_holded_purchases()")
+    echo("Starting transform_holded_purchases()")
     logging.info("Entered transform_holded_purchases()")
 
     try:
@@ -53,13 +102,16 @@ def transform_holded_purchases():
         os.makedirs(output_dir, exist_ok=True)
 
         # Load JSON
-        print(f"Loading data from {input_path}")
+        echo(f"Loading data from {input_path}")
         with open(input_path, "r", encoding="utf-8") as f:
             raw_data = json.load(f)
 
         records = raw_data["data"] if isinstance(raw_data, dict) and "data" in raw_data else raw_data
         df = pd.json_normalize(records)
 
+        # Release the parsed JSON objects; from here on the DataFrame is the only copy
+        del raw_data, records
+
         if df.empty:
             msg = "No purchases data found to transform."
             logging.warning(msg)
@@ -67,34 +119,48 @@ def transform_holded_purchases():
             return
 
         # Convert relevant Unix timestamps
-        timestamp_cols = [col for col in df.columns if col.lower() in ["createdat", "updatedat", "date", "payment_date"]]
+        timestamp_cols = [col for col in df.columns if col.lower() in TIMESTAMP_COLS]
         for col in timestamp_cols:
             if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], unit="s", errors="coerce")
 
-        # Identify and stringify list-type columns
-        list_columns = [col for col in df.columns if df[col].apply(lambda x: isinstance(x, list)).any()]
+        # Identify list-/dict-type columns. Holded returns one type per column,
+        # so sniffing the first non-null value is enough (no full-column scan).
+        list_columns, dict_columns = [], []
+        for col in df.select_dtypes(include="object").columns:
+            sample = first_non_null(df[col].to_numpy())
+            if isinstance(sample, list):
+                list_columns.append(col)
+            elif isinstance(sample, dict):
+                dict_columns.append(col)
+
+        # Stringify list-type columns
         if list_columns:
             warning_msg = f"List-type columns in purchases data: {list_columns}"
             logging.warning(warning_msg)
             print(warning_msg)
             for col in list_columns:
-                df[col] = df[col].apply(lambda x: str(x) if isinstance(x, list) else x)
+                df[col] = [str(v) if isinstance(v, list) else v for v in df[col].to_numpy()]
 
-        # Identify and stringify dict-type columns
-        dict_columns = [col for col in df.columns if df[col].apply(lambda x: isinstance(x, dict)).any()]
+        # Stringify dict-type columns
         if dict_columns:
             warning_msg = f"Dict-type columns in purchases data: {dict_columns}"
             logging.warning(warning_msg)
             print(warning_msg)
+            dumps = json.dumps
             for col in dict_columns:
-                df[col] = df[col].apply(lambda x: json.dumps(x) if isinstance(x, dict) else x)
+                df[col] = [dumps(v) if isinstance(v, dict) else v for v in df[col].to_numpy()]
 
         # Force known problematic fields to string
-        for col in ["vatnumber", "supplierId", "customId"]:
+        for col in STRING_COLS:
             if col in df.columns:
                 df[col] = df[col].astype(str)
 
+        # Dictionary-encode low-cardinality repeated strings (smaller Parquet, faster reads)
+        for col in CATEGORICAL_COLS:
+            if col in df.columns and df[col].nunique() / len(df) < 0.5:
+                df[col] = df[col].astype("category")
+
         # === Add EUR-converted columns ===
         required_cols = ["tax", "subtotal", "total", "currencyChange"]
         missing_cols = [col for col in required_cols if col not in df.columns]
@@ -108,23 +174,35 @@ def transform_holded_purchases():
             df["subtotal_eur"] = df["subtotal"] * df["currencyChange"]
             df["total_eur"] = df["total"] * df["currencyChange"]
             logging.info("EUR columns successfully added.")
-            print("EUR columns successfully added:")
-            print(df[["tax_eur", "subtotal_eur", "total_eur"].copy()].head())
+            echo("EUR columns successfully added.")
+
+        # Down-cast numeric columns to the smallest lossless dtype (EUR columns stay float64),
+        # for the Parquet copy only: CSV keeps float64, as float32's shortest repr would round it.
+        # (pandas narrows floats within a tolerance, so float32 is only kept
+        # when it round-trips exactly; otherwise money values would lose cents)
+        df_parquet = df.copy(deep=False)
+        for col in df.select_dtypes(include=["float64"]).columns:
+            if not col.endswith("_eur"):
+                narrowed = pd.to_numeric(df[col], downcast="float")
+                if narrowed.astype("float64").equals(df[col]):
+                    df_parquet[col] = narrowed
+        for col in df.select_dtypes(include=["int64"]).columns:
+            df_parquet[col] = pd.to_numeric(df[col], downcast="integer")
 
         # Save Parquet (with fallback)
         parquet_path = os.path.join(output_dir, base_filename + ".parquet")
-        save_parquet(df, parquet_path)
+        save_parquet(df_parquet, parquet_path)
         logging.info(f"Parquet saved to: {parquet_path}")
-        print(f"Parquet saved to: {parquet_path}")
+        echo(f"Parquet saved to: {parquet_path}")
 
         # Save CSV
         csv_path = os.path.join(output_dir, base_filename + ".csv")
-        df.to_csv(csv_path, index=False)
+        df.to_csv(csv_path, index=False, encoding="utf-8", chunksize=50_000)
         logging.info(f"CSV saved to: {csv_path}")
-        print(f"CSV saved to: {csv_path}")
+        echo(f"CSV saved to: {csv_path}")
 
         logging.info(f"Total cleaned Holded purchases: {len(df)}")
-        print(f"Total cleaned Holded purchases: {len(df)}")
+        echo(f"Total cleaned Holded purchases: {len(df)}")
 
     except Exception as e:
         logging.error(f"Failed to transform Holded purchases data: {e}", exc_info=True)
@@ -136,5 +214,8 @@ def transform_holded_purchases():
 # ============================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verbose", action="store_true", help="Echo progress messages to the console")
+    VERBOSE = parser.parse_args().verbose
     transform_holded_purchases()
 
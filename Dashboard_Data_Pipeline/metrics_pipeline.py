@@ -1,32 +1,351 @@
 import pandas as pd
+import numpy as np
 import os
+import glob
+import hashlib
+import shutil
 import argparse
+import functools
 from datetime import datetime
 
+# pyarrow is optional: resolved once here, the writers below fall back to pandas without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 
 # ------------------- Debug Utility -------------------
 def debug(message):
     print(f"DEBUG: {message}")
 
 # ------------------- Helper Functions -------------------
+def ensure_month_period(date_col):
+    """Convert a date column to monthly Periods (int64 ordinals underneath)."""
+    # Columns the pyarrow CSV reader already typed as timestamps need no parsing
+    if pd.api.types.is_datetime64_any_dtype(date_col):
+        return date_col.dt.to_period('M')
+    # All clean inputs carry ISO dates; naming the format skips per-call format inference
+    return pd.to_datetime(date_col, errors='coerce', format='ISO8601').dt.to_period('M')
+
 def ensure_month_format(date_col):
     """Convert a date column to YYYY-MM format string."""
-    return pd.to_datetime(date_col, errors='coerce').dt.to_period('M').astype(str)
+    return ensure_month_period(date_col).astype(str)
+
+def month_dtype(*period_cols):
+    """Ordered categorical dtype listing every 'YYYY-MM' between the earliest and latest of period_cols."""
+    periods = pd.concat(period_cols).dropna()
+    categories = pd.period_range(periods.min(), periods.max(), freq='M').astype(str) if not periods.empty else []
+    return pd.CategoricalDtype(categories=categories, ordered=True)
+
+def period_to_month(periods, months):
+    """
+    Encode monthly Periods as the categorical months dtype from month_dtype().
+    Codes are plain ordinal offsets from the first month, so no 'YYYY-MM'
+    string is formatted or hashed per row; NaT becomes a missing month.
+    """
+    if len(months.categories) == 0:
+        return pd.Series(pd.Categorical.from_codes(np.full(len(periods), -1), dtype=months), index=periods.index)
+    first = pd.Period(months.categories[0], freq='M').ordinal
+    codes = np.where(periods.isna(), -1, periods.array.asi8 - first)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=months), index=periods.index)
+
+def month_column(df, date_col):
+    """
+    Return the 'month' column run_pipeline precomputed on df, or derive it from date_col.
+    Only the categorical month from period_to_month() counts as precomputed: clean
+    inputs may carry their own 'month' (e.g. a 1-12 calendar month in the CM metrics).
+    """
+    if 'month' in df.columns and isinstance(df['month'].dtype, pd.CategoricalDtype):
+        return df['month']
+    return ensure_month_format(df[date_col])
 
-def save_parquet(df, path):
-    """Save a DataFrame to Parquet using pyarrow or fastparquet."""
-    try:
-        df.to_parquet(path, index=False, engine="pyarrow")
-    except ImportError:
+def sum_month_runs(codes, data):
+    """
+    Array core of monthly_sums(): sum the rows of the 2-D float array data per
+    month code, returning (month_codes, sums) in code order. Pure numpy, no
+    pandas objects, so it can be reused or compiled on its own. Codes < 0
+    (missing months) are dropped and NaN amounts count as 0.
+    """
+    data = np.nan_to_num(data)
+    if not (codes[1:] >= codes[:-1]).all():
+        order = np.argsort(codes, kind='stable')
+        codes, data = codes[order], data[order]
+    keep = codes >= 0
+    codes, data = codes[keep], data[keep]
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    sums = np.add.reduceat(data, starts, axis=0) if len(starts) else data[:0]
+    return codes[starts], sums
+
+def monthly_sums(month, values):
+    """
+    Sum each column of values per month, returned in month order.
+    For the categorical month from period_to_month() the codes are month
+    ordinals, so a stable argsort (skipped when already sorted) plus
+    np.add.reduceat over the run boundaries replaces groupby's hash table.
+    """
+    if not isinstance(month.dtype, pd.CategoricalDtype):
+        return values.groupby(month.to_numpy(), sort=True).sum().rename_axis('month').reset_index()
+    codes, sums = sum_month_runs(month.cat.codes.to_numpy(), values.to_numpy(dtype=float))
+    monthly = pd.DataFrame(sums, columns=values.columns)
+    monthly.insert(0, 'month', pd.Categorical.from_codes(codes, dtype=month.dtype))
+    return monthly
+
+def save_parquet(df, path, compression="snappy"):
+    """
+    Save a DataFrame to Parquet using pyarrow or fastparquet.
+    Outputs read by Power BI keep the default snappy codec; the internal
+    caches pass compression="zstd" for smaller files.
+    """
+    if pa is None:
         debug("pyarrow not found, falling back to fastparquet.")
-        df.to_parquet(path, index=False, engine="fastparquet")
+        df.to_parquet(path, index=False, engine="fastparquet", compression=compression)
+        return
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression=compression)
+
+def save_csv(df, path):
+    """Save a DataFrame to CSV with Arrow's multithreaded C++ writer, or pandas if pyarrow is missing."""
+    if pa is None:
+        df.to_csv(path, index=False)
+        return
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+# Cost tag searched for in each contact's 'tags' -> key used by the metrics below
+CONTACT_TAGS = {
+    'opex': 'opex',
+    'cogs': 'cogs',
+    'financial_costs': 'costes financieros',
+    'cac': 'cac',
+}
+
+def arrow_strings(col):
+    """Return col as a pyarrow-backed string column, or unchanged if pyarrow is not installed."""
+    return col.astype('string[pyarrow]') if pa is not None else col
+
+def lowercase_text(col):
+    """Lowercase a text column (nulls -> ''), on Arrow string kernels when pyarrow is available."""
+    return arrow_strings(col.fillna('').astype(str)).str.lower()
+
+def classify_contacts(df_contacts):
+    """
+    Scan the contacts table once and return the supplier IDs for every cost tag,
+    e.g. {'opex': array([...]), 'cogs': array([...]), ...} (keys from CONTACT_TAGS).
+    """
+    tags = lowercase_text(df_contacts['tags'])
+    is_supplier = (lowercase_text(df_contacts['type']) == 'supplier').to_numpy(dtype=bool)
+    ids = df_contacts['id'].to_numpy()
+
+    # One boolean mask per tag, all built from the same lowercased column
+    tag_masks = {
+        name: is_supplier & tags.str.contains(keyword, regex=False).to_numpy(dtype=bool)
+        for name, keyword in CONTACT_TAGS.items()
+    }
+    return {name: ids[mask] for name, mask in tag_masks.items()}
+
+def monthly_supplier_costs(df_purchases):
+    """
+    Sum confirmed purchases (status == 1) in EUR per month and contact in a single
+    pass over df_purchases. The tag-based cost metrics and net burn then only
+    re-aggregate this much smaller table instead of rescanning the purchases.
+    """
+    df_confirmed = df_purchases[df_purchases['status'] == 1]
+    return (
+        df_confirmed
+        .assign(month=month_column(df_confirmed, 'date'))
+        .groupby(['month', 'contact'], as_index=False, sort=False, observed=True, dropna=False)['total_eur']
+        .sum()
+    )
+
+def tagged_supplier_costs(df_supplier_costs, supplier_ids, df_purchases):
+    """
+    Rows of the monthly supplier totals whose 'contact' is one of supplier_ids.
+    When no supplier carries the tag, return an empty table straight away and
+    skip both building the totals and the isin() scan.
+    """
+    if len(supplier_ids) == 0:
+        return pd.DataFrame(columns=['month', 'contact', 'total_eur'])
+    if df_supplier_costs is None:
+        df_supplier_costs = monthly_supplier_costs(df_purchases)
+    return df_supplier_costs[df_supplier_costs['contact'].isin(supplier_ids)]
 
 def validate_columns(df, required, df_name):
     """Ensure that required columns exist in the DataFrame."""
-    missing = [col for col in required if col not in df.columns]
+    missing = sorted(set(required).difference(df.columns))
     if missing:
         raise ValueError(f"{df_name} is missing columns: {missing}")
 
+# ------------------- Input Sources -------------------
+# Clean input files and the only columns the metrics below read from them.
+# Each CSV is converted once to a Parquet cache and only these columns are
+# decoded from it (projection pushdown), so wide exports don't pay for fields
+# no metric uses.
+INPUT_SOURCES = {
+    'customers': (
+        'data/INPUT/chartmogul_customers/clean/chartmogul_customers_clean.csv',
+        ['uuid', 'customer-since'],
+    ),
+    'purchases': (
+        'data/INPUT/holded_purchases/clean/holded_purchases_clean.csv',
+        ['date', 'contact', 'status', 'total', 'total_eur'],
+    ),
+    'contacts': (
+        'data/INPUT/holded_contacts/clean/holded_contacts_clean.csv',
+        ['id', 'tags', 'type'],
+    ),
+    'mrr_components': (
+        'data/INPUT/chartmogul_mrr_components/clean/chartmogul_mrr_components_clean.csv',
+        ['date', 'mrr', 'mrr-new-business', 'mrr-expansion', 'mrr-contraction', 'mrr-churn'],
+    ),
+    'cm_metrics': (
+        'data/INPUT/chartmogul_metrics/clean/chartmogul_metrics_clean.csv',
+        ['month_start', 'arpa', 'customers', 'customer-churn-rate', 'mrr-churn-rate', 'ltv'],
+    ),
+    'treasury': (
+        'data/INPUT/holded_treasury/clean/holded_treasury_clean.csv',
+        ['month', 'date', 'cash_balance_eur', 'balance_eur', 'ending_balance', 'balance', 'cash'],
+    ),
+}
+
+CACHE_DIR = os.path.join("data", "CACHE")
+
+def cache_parquet(csv_path):
+    """
+    Return the path of a Parquet copy of csv_path under data/CACHE/.
+    The copy is (re)built whenever it is missing or older than the CSV.
+    """
+    cache_path = os.path.join(CACHE_DIR, os.path.splitext(os.path.basename(csv_path))[0] + '.parquet')
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(csv_path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if pa is not None:
+            # Arrow's multithreaded CSV reader; ISO date columns come back as timestamps
+            df = pd.read_csv(csv_path, engine="pyarrow")
+        else:
+            df = pd.read_csv(csv_path, low_memory=False)
+        save_parquet(df, cache_path, compression="zstd")
+        debug(f"Cached {csv_path} -> {cache_path}")
+    return cache_path
+
+def load_input(name):
+    """
+    Read one clean input from its Parquet cache, decoding only the columns listed in INPUT_SOURCES.
+    With pyarrow, text columns stay Arrow-backed (string[pyarrow]) instead of
+    being materialised as Python objects, so the str kernels run on Arrow compute.
+    """
+    path, columns = INPUT_SOURCES[name]
+    available = pd.read_csv(path, nrows=0).columns
+    columns = [col for col in columns if col in available]
+    if pa is None:
+        return pd.read_parquet(cache_parquet(path), columns=columns)
+    arrow_text = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+    return pq.read_table(cache_parquet(path), columns=columns).to_pandas(types_mapper=arrow_text.get)
+
+# ------------------- Metric Cache -------------------
+# Metrics 1-20 depend only on the input files (and this script), so their
+# monthly results are stored under data/CACHE/metrics/ keyed by a fingerprint
+# of those files. While nothing changes, a re-run reads them back instead of
+# recomputing. Runway is not cached because it also depends on --cash.
+# run_pipeline passes the fingerprint to each call as cache_key=...; calls
+# without it (standalone use on arbitrary frames) always compute.
+METRIC_CACHE_DIR = os.path.join(CACHE_DIR, "metrics")
+
+def inputs_fingerprint():
+    """Short hash of (path, mtime, size) for every input CSV and this script."""
+    digest = hashlib.md5()
+    for path in [path for path, _ in INPUT_SOURCES.values()] + [os.path.abspath(__file__)]:
+        stat = os.stat(path)
+        digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+    return digest.hexdigest()[:12]
+
+def cached_metric(func):
+    """
+    Serve func's result from data/CACHE/metrics/ for the inputs fingerprint
+    given as cache_key. Without a cache_key the cache is bypassed entirely.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, cache_key=None, **kwargs):
+        if cache_key is None:
+            return func(*args, **kwargs)
+        name = func.__name__.replace('calculate_', '')
+        cache_path = os.path.join(METRIC_CACHE_DIR, f"{name}-{cache_key}.parquet")
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path)
+        df = func(*args, **kwargs)
+        os.makedirs(METRIC_CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(METRIC_CACHE_DIR, f"{name}-*.parquet")):
+            os.remove(stale)
+        save_parquet(df, cache_path, compression="zstd")
+        return df
+    return wrapper
+
+# --------------------------------------------------------------------------
+# 1-7. MRR Bundle (shared aggregation of ChartMogul MRR components)
+#    ───────────────────────────────────
+#
+# * Metrics 1-7 are all monthly sums over df_CM_mrr_components_clean, so they
+#   are computed together: one 'month' key, one groupby, one scan of the table.
+#   calculate_mrr() ... calculate_arr() below select their column from it.
+#
+# * Flowchart:
+#     df_CM_mrr_components_clean
+#         └── Narrow frame of renamed components, abs() on expansion/losses
+#             └── Group by 'month' and sum all components at once
+#                 └── net_new_mrr and arr derived on the monthly rows
+# --------------------------------------------------------------------------
+@cached_metric
+def calculate_mrr_bundle(df_mrr_components):
+    """
+    Aggregate every ChartMogul MRR component per month in a single groupby pass.
+
+    Parameters:
+        df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data
+
+    Returns:
+        pd.DataFrame: One row per month with:
+            - 'month' (YYYY-MM)
+            - 'mrr', 'expansion_mrr', 'contraction_mrr', 'new_mrr',
+              'churned_mrr', 'net_new_mrr', 'arr'
+    """
+
+    # ----------------------------------------------------------------------
+    # STEP 1: Build a narrow frame with 'month' and the renamed components
+    # ----------------------------------------------------------------------
+    # Only the columns being summed are materialised; the rest of the
+    # ChartMogul export is never copied. Expansion, contraction and churn are
+    # stored as positive amounts (np.fabs on the raw arrays). Net New MRR has always used the signed
+    # expansion value, so the raw 'mrr-expansion' column is summed as well.
+    df = pd.DataFrame({
+        'month': month_column(df_mrr_components, 'date'),
+        'mrr': df_mrr_components['mrr'],
+        'expansion_mrr': np.fabs(df_mrr_components['mrr-expansion'].to_numpy(dtype=float)),
+        'contraction_mrr': np.fabs(df_mrr_components['mrr-contraction'].to_numpy(dtype=float)),
+        'new_mrr': df_mrr_components['mrr-new-business'],
+        'churned_mrr': np.fabs(df_mrr_components['mrr-churn'].to_numpy(dtype=float)),
+        'mrr-expansion': df_mrr_components['mrr-expansion'],
+    })
+
+    # ----------------------------------------------------------------------
+    # STEP 2: One monthly reduction for all components
+    # ----------------------------------------------------------------------
+    # ChartMogul exports are date-ordered, so this is usually a single
+    # linear reduceat pass over month runs (see monthly_sums()).
+    monthly = monthly_sums(df['month'], df.drop(columns='month'))
+
+    # ----------------------------------------------------------------------
+    # STEP 3: Derive Net New MRR and ARR on the monthly rows
+    # ----------------------------------------------------------------------
+    monthly['net_new_mrr'] = (
+        monthly['new_mrr']
+        + monthly['mrr-expansion']
+        - monthly['contraction_mrr']
+        - monthly['churned_mrr']
+    )
+    monthly['arr'] = monthly['mrr'] * 12
+
+    return monthly[['month', 'mrr', 'expansion_mrr', 'contraction_mrr', 'new_mrr',
+                    'churned_mrr', 'net_new_mrr', 'arr']]
+
 # --------------------------------------------------------------------------
 #                   SUMMARY OF METRIC CREATION PROCESS:
 # --------------------------------------------------------------------------
@@ -60,38 +379,22 @@ def validate_columns(df, required, df_name):
 #     - Optionally cross-validate against df_CM_metrics_clean['mrr']
 #     - Check for missing or anomalous dates in source file
 # --------------------------------------------------------------------------
-def calculate_mrr(df):
+def calculate_mrr(df, df_mrr_bundle=None):
     """
     Calculate Monthly Recurring Revenue (MRR) from ChartMogul MRR components.
 
     Parameters:
         df (pd.DataFrame): ChartMogul MRR components table in cleaned format
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df)
 
     Returns:
         pd.DataFrame: Monthly aggregated table containing:
             - 'month' (YYYY-MM)
             - 'mrr'
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Extract 'month' from 'date'
-    # ----------------------------------------------------------------------
-    # Converts the ChartMogul date column into a YYYY-MM format string.
-    # This ensures consistent grouping and merging with other metrics.
-    df_copy = df.copy()
-    df_copy['month'] = ensure_month_format(df_copy['date'])
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Aggregate total MRR by month
-    # ----------------------------------------------------------------------
-    # Groups data by 'month' and sums the 'mrr' column to produce a
-    # single row per month representing total recurring revenue.
-    df_out = df_copy.groupby('month', as_index=False)['mrr'].sum()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Return the aggregated table
-    # ----------------------------------------------------------------------
-    return df_out
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df)
+    return df_mrr_bundle[['month', 'mrr']]
 
 # --------------------------------------------------------------------------
 # 2. Expansion MRR            * VALID: Taken directly from CM_Metrics
@@ -129,49 +432,18 @@ def calculate_mrr(df):
 #     - Should match ChartMogul's "Expansion" component in the MRR movements report
 #     - Check for months with unexpected zeros or negatives
 # --------------------------------------------------------------------------
-def calculate_expansion_mrr(df_mrr_components):
+def calculate_expansion_mrr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate Expansion Monthly Recurring Revenue (expansion_mrr) 
     from existing customer upgrades and add-ons.
-    """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Standardize the MRR expansion column name
-    # ----------------------------------------------------------------------
-    # ChartMogul exports this metric as 'mrr-expansion'.
-    # We rename it to 'expansion_mrr' for:
-    #   - Consistency across all functions
-    #   - Easier referencing in downstream merges
-    # Note:
-    #   If df_mrr_components has already been processed by calculate_mrr_components,
-    #   this column may already be named 'expansion_mrr'.
-    #   In that case, this rename will have no effect (pandas will ignore it).
-    df = df_mrr_components.rename(columns={'mrr-expansion': 'expansion_mrr'}).copy()
 
-    # ----------------------------------------------------------------------
-    # STEP 2: Extract 'month' in YYYY-MM format from 'date'
-    # ----------------------------------------------------------------------
-    # Converts the raw 'date' into a 'month' column for grouping.
-    # This ensures that all expansion MRR values are aggregated monthly.
-    df['month'] = ensure_month_format(df['date'])
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Ensure expansion_mrr is positive
-    # ----------------------------------------------------------------------
-    # ChartMogul normally reports only positive values for expansion MRR,
-    # but we enforce abs() here as a safeguard in case of data anomalies.
-    df['expansion_mrr'] = df['expansion_mrr'].abs()
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Aggregate total expansion MRR per month
-    # ----------------------------------------------------------------------
-    # Group by 'month' and sum all expansion MRR values to get:
-    #   - Total monthly recurring revenue gained from upsells,
-    #     plan upgrades, or cross-sells to existing customers.
-    df = df.groupby('month', as_index=False)['expansion_mrr'].sum()
-
-    # Return the monthly aggregated expansion MRR
-    return df
+    Parameters:
+        df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
+    """
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'expansion_mrr']]
 
 # --------------------------------------------------------------------------
 # 3. Contraction MRR            * VALID: Taken directly from CM_Metrics
@@ -209,51 +481,23 @@ def calculate_expansion_mrr(df_mrr_components):
 #     - Should match ChartMogul's "Contraction" component in the MRR movements report
 #     - Compare with churned_mrr to ensure no overlaps
 # --------------------------------------------------------------------------
-def calculate_contraction_mrr(df_mrr_components):
+def calculate_contraction_mrr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate Contraction Monthly Recurring Revenue (contraction_mrr)
     from existing customer downgrades or partial cancellations.
 
     Parameters:
         df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data.
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
 
     Returns:
         pd.DataFrame: DataFrame with:
             - 'month' (str, YYYY-MM)
             - 'contraction_mrr' (float)
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Rename the ChartMogul contraction column to 'contraction_mrr'
-    # ----------------------------------------------------------------------
-    # This aligns with the naming conventions used across the pipeline.
-    # If the column is already renamed, pandas will silently ignore it.
-    df = df_mrr_components.rename(columns={'mrr-contraction': 'contraction_mrr'}).copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Extract 'month' in YYYY-MM format from 'date'
-    # ----------------------------------------------------------------------
-    # Ensures monthly granularity for all time-series metric aggregation.
-    df['month'] = ensure_month_format(df['date'])
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Convert contraction_mrr values to positive
-    # ----------------------------------------------------------------------
-    # ChartMogul exports these values as negatives (losses), but we
-    # want to store them as positive numbers for reporting clarity.
-    df['contraction_mrr'] = df['contraction_mrr'].abs()
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Group by 'month' and sum the contraction values
-    # ----------------------------------------------------------------------
-    # This results in one row per month with the total amount of MRR
-    # lost to partial downgrades or cancellations.
-    df = df.groupby('month', as_index=False)['contraction_mrr'].sum()
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return the final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'contraction_mrr']]
 
 # --------------------------------------------------------------------------
 # 4. New MRR (New Monthly Recurring Revenue)            * VALID: Taken directly from CM_Metrics
@@ -291,43 +535,20 @@ def calculate_contraction_mrr(df_mrr_components):
 #     - No customer-level breakdown available from current schema
 # --------------------------------------------------------------------------
 
-def calculate_new_mrr(df_mrr_components):
+def calculate_new_mrr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate New Monthly Recurring Revenue (new_mrr) from first-time customers.
     
     Parameters:
         df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
 
     Returns:
         pd.DataFrame: DataFrame with 'month' and 'new_mrr' columns
     """
-    # ----------------------------------------------------------------------
-    # STEP 1: Rename the raw ChartMogul column for clarity and consistency
-    # ----------------------------------------------------------------------
-    # ChartMogul names the column 'mrr-new-business' for first-time customer MRR.
-    # We rename it to 'new_mrr' to make it easier to reference consistently across the pipeline.
-    # NOTE: This assumes df_mrr_components is in raw format; if it already has 'new_mrr',
-    # the rename will simply have no effect.
-    df = df_mrr_components.rename(columns={'mrr-new-business': 'new_mrr'})
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Convert the 'date' column to YYYY-MM month format
-    # ----------------------------------------------------------------------
-    # This standardises the month representation for grouping, regardless of the original date format.
-    df['month'] = ensure_month_format(df['date'])
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Aggregate total new MRR per month
-    # ----------------------------------------------------------------------
-    # Group the data by 'month' and sum all 'new_mrr' values.
-    # If there are multiple rows for the same month (e.g., multiple customers),
-    # this will aggregate them into a single monthly total.
-    df = df.groupby('month', as_index=False)['new_mrr'].sum()
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Return the monthly new MRR DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'new_mrr']]
 
 # --------------------------------------------------------------------------
 # 5. Churned MRR            * VALID: Taken directly from CM_Metrics
@@ -366,50 +587,21 @@ def calculate_new_mrr(df_mrr_components):
 #     - Important for calculating revenue churn rate
 # --------------------------------------------------------------------------
 
-def calculate_churned_mrr(df_mrr_components):
+def calculate_churned_mrr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate Churned Monthly Recurring Revenue (churned_mrr)
     from customers who fully cancelled their subscriptions.
 
     Parameters:
         df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data.
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
 
     Returns:
         pd.DataFrame: 'month' and 'churned_mrr' columns
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Rename ChartMogul's churn column to 'churned_mrr'
-    # ----------------------------------------------------------------------
-    # - The raw ChartMogul export uses 'mrr-churn'
-    # - We rename to 'churned_mrr' for consistency with naming conventions
-    df = df_mrr_components.rename(columns={'mrr-churn': 'churned_mrr'}).copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Extract 'month' from the 'date' column
-    # ----------------------------------------------------------------------
-    # - Convert ChartMogul's full date to YYYY-MM format
-    # - This ensures aggregation is done at a monthly level
-    df['month'] = ensure_month_format(df['date'])
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Ensure churned MRR is stored as a positive number
-    # ----------------------------------------------------------------------
-    # - ChartMogul reports churned MRR as negative values
-    # - Taking the absolute value avoids negative metrics in reporting
-    df['churned_mrr'] = df['churned_mrr'].abs()
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Aggregate churned MRR by month
-    # ----------------------------------------------------------------------
-    # - Group data by 'month'
-    # - Sum churned MRR for each month
-    df = df.groupby('month', as_index=False)['churned_mrr'].sum()
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'churned_mrr']]
 
 # --------------------------------------------------------------------------
 # 6. Net New MRR (Net Monthly Recurring Revenue)            * VALID: Calculated using metrics taken directly from CM_Metrics
@@ -461,41 +653,18 @@ def calculate_churned_mrr(df_mrr_components):
 #       excluding returning/cancelled users
 # --------------------------------------------------------------------------
 
-def calculate_net_new_mrr(df_mrr_components):
+def calculate_net_new_mrr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate Net New Monthly Recurring Revenue:
     new_mrr + expansion_mrr - contraction_mrr - churned_mrr
-    """
-
-    # Step 1: Rename columns for consistency
-    df = df_mrr_components.rename(columns={
-        'mrr-new-business': 'new_mrr',
-        'mrr-expansion': 'expansion_mrr',
-        'mrr-contraction': 'contraction_mrr',
-        'mrr-churn': 'churned_mrr'
-    })
 
-    # Step 2: Extract 'month' in YYYY-MM format
-    df['month'] = ensure_month_format(df['date'])
-
-    # Step 3: Convert churn-related values to positive
-    df['churned_mrr'] = df['churned_mrr'].abs()
-    df['contraction_mrr'] = df['contraction_mrr'].abs()
-
-    # Step 4: Group and sum all relevant columns
-    grouped = df.groupby('month', as_index=False)[
-        ['new_mrr', 'expansion_mrr', 'contraction_mrr', 'churned_mrr']
-    ].sum()
-
-    # Step 5: Compute Net New MRR
-    grouped['net_new_mrr'] = (
-        grouped['new_mrr']
-        + grouped['expansion_mrr']
-        - grouped['contraction_mrr']
-        - grouped['churned_mrr']
-    )
-
-    return grouped[['month', 'net_new_mrr']]
+    Parameters:
+        df_mrr_components (pd.DataFrame): Cleaned ChartMogul MRR components data
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
+    """
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'net_new_mrr']]
 
 # --------------------------------------------------------------------------
 # 7. ARR (Annual Recurring Revenue)            * VALID: Taken directly from CM_Metrics
@@ -531,7 +700,7 @@ def calculate_net_new_mrr(df_mrr_components):
 #     - Matches reported ARR in df_CM_metrics_clean['arr']
 # --------------------------------------------------------------------------
 
-def calculate_arr(df_mrr_components):
+def calculate_arr(df_mrr_components, df_mrr_bundle=None):
     """
     Calculate Annual Recurring Revenue (ARR) from MRR values per month.
 
@@ -545,6 +714,7 @@ def calculate_arr(df_mrr_components):
             Cleaned ChartMogul MRR components data containing:
             - 'date' (str/date): Date associated with MRR value
             - 'mrr' (float): Monthly Recurring Revenue
+        df_mrr_bundle (pd.DataFrame, optional): Output of calculate_mrr_bundle(df_mrr_components)
 
     Returns:
         pd.DataFrame:
@@ -552,32 +722,62 @@ def calculate_arr(df_mrr_components):
             - 'month' (str, YYYY-MM)
             - 'arr' (float): Annual Recurring Revenue
     """
-    # ----------------------------------------------------------------------
-    # STEP 1: Extract 'month' from the 'date' column
-    # ----------------------------------------------------------------------
-    # Converts the full date into a YYYY-MM string to allow
-    # grouping at the monthly level.
-    df = df_mrr_components.copy()
-    df['month'] = ensure_month_format(df['date'])
+    if df_mrr_bundle is None:
+        df_mrr_bundle = calculate_mrr_bundle(df_mrr_components)
+    return df_mrr_bundle[['month', 'arr']]
 
-    # ----------------------------------------------------------------------
-    # STEP 2: Group by 'month' and sum MRR
-    # ----------------------------------------------------------------------
-    # Aggregates all MRR entries in the same month to get
-    # the total monthly recurring revenue.
-    monthly_mrr = df.groupby('month', as_index=False)['mrr'].sum()
+# --------------------------------------------------------------------------
+# 8-12. ChartMogul Metrics Bundle (shared projection of CM_Metrics)
+#    ───────────────────────────────────
+#
+# * Metrics 8-12 are columns ChartMogul already reports per month, so they
+#   are read together: one validation, one 'month' key, one projection of
+#   df_CM_metrics_clean. calculate_arpa() ... calculate_ltv() below select
+#   their column from it.
+#
+# * Flowchart:
+#     df_CM_metrics_clean
+#         └── Take 'month' from 'month_start'
+#             └── Project arpa, customers, churn rates and ltv into one frame
+# --------------------------------------------------------------------------
+# ChartMogul metrics columns behind metrics 8-12
+CM_METRIC_COLUMNS = ('arpa', 'customers', 'customer-churn-rate', 'mrr-churn-rate', 'ltv')
+
+@cached_metric
+def calculate_cm_bundle(df_cm_metrics, metrics=CM_METRIC_COLUMNS):
+    """
+    Project the requested ChartMogul-reported metrics (8-12) into one frame in a single pass.
+
+    Parameters:
+        df_cm_metrics (pd.DataFrame): Cleaned ChartMogul metrics data
+        metrics (iterable of str, optional): Columns of CM_METRIC_COLUMNS to include;
+            all five by default. Only their source columns are validated.
+
+    Returns:
+        pd.DataFrame: One row per month with:
+            - 'month' (YYYY-MM)
+            - one column per requested metric, e.g. 'arpa', 'customers',
+              'customer-churn-rate', 'mrr-churn-rate', 'ltv'
+    """
 
     # ----------------------------------------------------------------------
-    # STEP 3: Calculate ARR as MRR × 12
+    # STEP 1: Validate the columns the requested metrics need
     # ----------------------------------------------------------------------
-    # Projects the monthly MRR to a yearly value assuming no change
-    # over the next 12 months.
-    monthly_mrr['arr'] = monthly_mrr['mrr'] * 12
+    validate_columns(
+        df_cm_metrics,
+        ['month_start', *metrics],
+        "ChartMogul Metrics"
+    )
 
     # ----------------------------------------------------------------------
-    # STEP 4: Return the 'month' and 'arr' columns only
+    # STEP 2: Build the output from 'month' and the requested metric columns
     # ----------------------------------------------------------------------
-    return monthly_mrr[['month', 'arr']]
+    # Only these columns are projected into the new frame (the input is never
+    # copied or modified).
+    return pd.DataFrame({
+        'month': month_column(df_cm_metrics, 'month_start'),
+        **{metric: df_cm_metrics[metric] for metric in metrics},
+    })
 
 # --------------------------------------------------------------------------
 # 8. ARPA from Chartmogul           * VALID: Taken directly from CM_Metrics
@@ -616,7 +816,7 @@ def calculate_arr(df_mrr_components):
 #     - No customer-level granularity available
 # --------------------------------------------------------------------------
 
-def calculate_arpa(df_cm_metrics):
+def calculate_arpa(df_cm_metrics, df_cm_bundle=None):
     """
     Extract ChartMogul-calculated Average Revenue Per Account (ARPA) per month.
 
@@ -631,6 +831,7 @@ def calculate_arpa(df_cm_metrics):
             Cleaned ChartMogul metrics table containing:
             - 'month_start' (str/date): First day of the month
             - 'arpa' (float): Average revenue per account for the month
+        df_cm_bundle (pd.DataFrame, optional): Output of calculate_cm_bundle(df_cm_metrics)
 
     Returns:
         pd.DataFrame:
@@ -638,36 +839,9 @@ def calculate_arpa(df_cm_metrics):
             - 'month' (str, YYYY-MM)
             - 'arpa' (float): ChartMogul-calculated ARPA
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Validate required columns exist
-    # ----------------------------------------------------------------------
-    # Ensures 'month_start' and 'arpa' columns are present in df_cm_metrics
-    validate_columns(df_cm_metrics, ['month_start', 'arpa'], "ChartMogul Metrics")
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Work on a copy of the DataFrame
-    # ----------------------------------------------------------------------
-    # Prevents accidental modifications to the original DataFrame.
-    df = df_cm_metrics.copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Extract 'month' from 'month_start'
-    # ----------------------------------------------------------------------
-    # Converts the first day of the month into YYYY-MM format for grouping
-    # and merging with other metrics.
-    df['month'] = ensure_month_format(df['month_start'])
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Select relevant columns and rename 'arpa' to 'arpa'
-    # ----------------------------------------------------------------------
-    # Matches the naming convention used across the pipeline for ChartMogul ARPA.
-    df = df[['month', 'arpa']]
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_cm_bundle is None:
+        df_cm_bundle = calculate_cm_bundle(df_cm_metrics, ['arpa'])
+    return df_cm_bundle[['month', 'arpa']]
 
 # --------------------------------------------------------------------------
 # 9. Customer Count (customers)                        * VALID: Taken directly from CM_Metrics
@@ -694,7 +868,7 @@ def calculate_arpa(df_cm_metrics):
 #             └── Select 'customers'
 # --------------------------------------------------------------------------
 
-def calculate_customers(df_cm_metrics):
+def calculate_customers(df_cm_metrics, df_cm_bundle=None):
     """
     Extract the number of customers per month as reported by ChartMogul.
 
@@ -703,6 +877,7 @@ def calculate_customers(df_cm_metrics):
             Cleaned ChartMogul metrics data containing:
             - 'month_start' (str/date): First day of the month
             - 'customers' (int): Total number of active customers
+        df_cm_bundle (pd.DataFrame, optional): Output of calculate_cm_bundle(df_cm_metrics)
 
     Returns:
         pd.DataFrame:
@@ -710,30 +885,9 @@ def calculate_customers(df_cm_metrics):
             - 'month' (str, YYYY-MM)
             - 'customers' (int)
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Validate required columns exist
-    # ----------------------------------------------------------------------
-    # Ensures that the input contains the required fields
-    validate_columns(df_cm_metrics, ['month_start', 'customers'], "ChartMogul Metrics")
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Work on a copy and extract 'month'
-    # ----------------------------------------------------------------------
-    # Avoids modifying the original DataFrame
-    df = df_cm_metrics.copy()
-    df['month'] = ensure_month_format(df['month_start'])
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Select columns
-    # ----------------------------------------------------------------------
-    # Keeps only the customer count per month 
-    df = df[['month', 'customers']]
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_cm_bundle is None:
+        df_cm_bundle = calculate_cm_bundle(df_cm_metrics, ['customers'])
+    return df_cm_bundle[['month', 'customers']]
 
 # --------------------------------------------------------------------------
 # 10. Customer Churn Rate           * VALID: Taken directly from CM_Metrics
@@ -771,7 +925,7 @@ def calculate_customers(df_cm_metrics):
 #     - Compare with a local churn calculation for data validation if needed
 # --------------------------------------------------------------------------
 
-def calculate_customer_churn_rate(df_cm_metrics):
+def calculate_customer_churn_rate(df_cm_metrics, df_cm_bundle=None):
     """
     Calculate the monthly Customer Churn Rate (customer_churn_rate)
     as reported by ChartMogul.
@@ -787,42 +941,17 @@ def calculate_customer_churn_rate(df_cm_metrics):
             Cleaned ChartMogul metrics table containing:
             - 'month_start' (str/date): First day of the month
             - 'customer-churn-rate' (float): Monthly churn rate percentage
+        df_cm_bundle (pd.DataFrame, optional): Output of calculate_cm_bundle(df_cm_metrics)
 
     Returns:
         pd.DataFrame:
             DataFrame with:
             - 'month' (str, YYYY-MM)
-            - 'customer_churn_rate' (float)
+            - 'customer-churn-rate' (float)
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Validate required columns exist
-    # ----------------------------------------------------------------------
-    # Ensures 'month_start' and 'customer-churn-rate' are present before processing
-    validate_columns(df_cm_metrics, ['month_start', 'customer-churn-rate'], "ChartMogul Metrics")
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Work on a copy of the DataFrame
-    # ----------------------------------------------------------------------
-    # Prevents accidental modification of the original DataFrame
-    df = df_cm_metrics.copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Extract 'month' from 'month_start'
-    # ----------------------------------------------------------------------
-    # Converts the first day of the month into YYYY-MM format
-    # for grouping/merging with other metrics
-    df['month'] = ensure_month_format(df['month_start'])
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Select relevant columns
-    # ----------------------------------------------------------------------
-    df = df[['month', 'customer-churn-rate']]
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_cm_bundle is None:
+        df_cm_bundle = calculate_cm_bundle(df_cm_metrics, ['customer-churn-rate'])
+    return df_cm_bundle[['month', 'customer-churn-rate']]
 
 # --------------------------------------------------------------------------
 # 11. Revenue Churn Rate                * VALID: Taken directly from CM_Metrics
@@ -857,7 +986,7 @@ def calculate_customer_churn_rate(df_cm_metrics):
 #                 └── Rename to 'revenue_churn_rate'
 # --------------------------------------------------------------------------
 
-def calculate_revenue_churn_rate(df_cm_metrics):
+def calculate_revenue_churn_rate(df_cm_metrics, df_cm_bundle=None):
     """
     Calculate the monthly Revenue Churn Rate (revenue_churn_rate)
     as reported by ChartMogul.
@@ -873,42 +1002,17 @@ def calculate_revenue_churn_rate(df_cm_metrics):
             Cleaned ChartMogul metrics table containing:
             - 'month_start' (str/date): First day of the month
             - 'mrr-churn-rate' (float): Monthly MRR churn rate percentage
+        df_cm_bundle (pd.DataFrame, optional): Output of calculate_cm_bundle(df_cm_metrics)
 
     Returns:
         pd.DataFrame:
             DataFrame with:
             - 'month' (str, YYYY-MM)
-            - 'revenue_churn_rate' (float)
+            - 'mrr-churn-rate' (float)
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Validate required columns exist
-    # ----------------------------------------------------------------------
-    # Ensures 'month_start' and 'mrr-churn-rate' are present before processing
-    validate_columns(df_cm_metrics, ['month_start', 'mrr-churn-rate'], "ChartMogul Metrics")
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Work on a copy of the DataFrame
-    # ----------------------------------------------------------------------
-    # Prevents accidental modification of the original DataFrame
-    df = df_cm_metrics.copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Extract 'month' from 'month_start'
-    # ----------------------------------------------------------------------
-    # Converts the first day of the month into YYYY-MM format
-    # for grouping/merging with other metrics
-    df['month'] = ensure_month_format(df['month_start'])
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Select relevant columns
-    # ----------------------------------------------------------------------
-    df = df[['month', 'mrr-churn-rate']]
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_cm_bundle is None:
+        df_cm_bundle = calculate_cm_bundle(df_cm_metrics, ['mrr-churn-rate'])
+    return df_cm_bundle[['month', 'mrr-churn-rate']]
 
 # --------------------------------------------------------------------------
 # 12. Customer Lifetime Value               * VALID: Taken directly from CM_Metrics
@@ -943,7 +1047,7 @@ def calculate_revenue_churn_rate(df_cm_metrics):
 #                 └── Rename to 'ltv'
 # --------------------------------------------------------------------------
 
-def calculate_ltv(df_cm_metrics):
+def calculate_ltv(df_cm_metrics, df_cm_bundle=None):
     """
     Calculate the monthly Customer Lifetime Value (ltv)
     as reported by ChartMogul.
@@ -959,6 +1063,7 @@ def calculate_ltv(df_cm_metrics):
             Cleaned ChartMogul metrics table containing:
             - 'month_start' (str/date): First day of the month
             - 'ltv' (float): Average lifetime value per customer
+        df_cm_bundle (pd.DataFrame, optional): Output of calculate_cm_bundle(df_cm_metrics)
 
     Returns:
         pd.DataFrame:
@@ -966,35 +1071,9 @@ def calculate_ltv(df_cm_metrics):
             - 'month' (str, YYYY-MM)
             - 'ltv' (float)
     """
-
-    # ----------------------------------------------------------------------
-    # STEP 1: Validate required columns exist
-    # ----------------------------------------------------------------------
-    # Ensures 'month_start' and 'ltv' are present before processing
-    validate_columns(df_cm_metrics, ['month_start', 'ltv'], "ChartMogul Metrics")
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Work on a copy of the DataFrame
-    # ----------------------------------------------------------------------
-    # Prevents accidental modification of the original DataFrame
-    df = df_cm_metrics.copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Extract 'month' from 'month_start'
-    # ----------------------------------------------------------------------
-    # Converts the first day of the month into YYYY-MM format
-    # for grouping/merging with other metrics
-    df['month'] = ensure_month_format(df['month_start'])
-
-    # ----------------------------------------------------------------------
-    # STEP 4: Select relevant columns 
-    # ----------------------------------------------------------------------
-    df = df[['month', 'ltv']]
-
-    # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
-    # ----------------------------------------------------------------------
-    return df
+    if df_cm_bundle is None:
+        df_cm_bundle = calculate_cm_bundle(df_cm_metrics, ['ltv'])
+    return df_cm_bundle[['month', 'ltv']]
 
 # --------------------------------------------------------------------------
 # 13. Customer Acquisition Cost (CAC)           * VALID: 
@@ -1065,7 +1144,8 @@ def calculate_ltv(df_cm_metrics):
 #     - Ensure 'total_eur' is used consistently across all EUR-normalized metrics.
 # --------------------------------------------------------------------------
 
-def calculate_cac(df_purchases, df_contacts, df_cm_customers):
+@cached_metric
+def calculate_cac(df_purchases, df_contacts, df_cm_customers, contact_ids=None, df_supplier_costs=None):
     """
     Calculate Customer Acquisition Cost (CAC) using EUR-normalized purchase totals
     and the number of new customers per month.
@@ -1087,8 +1167,12 @@ def calculate_cac(df_purchases, df_contacts, df_cm_customers):
             - 'type'         (contact type, e.g., supplier)
         df_cm_customers (pd.DataFrame):
             Cleaned ChartMogul customers data with:
-            - 'uuid'             (unique customer ID)
+            - 'uuid'             (unique customer ID, one row per customer and month)
             - 'customer-since'   (date of first paid subscription)
+        contact_ids (dict, optional):
+            Output of classify_contacts(df_contacts); computed here when omitted
+        df_supplier_costs (pd.DataFrame, optional):
+            Output of monthly_supplier_costs(df_purchases); computed here when omitted
 
     Returns:
         pd.DataFrame:
@@ -1100,51 +1184,40 @@ def calculate_cac(df_purchases, df_contacts, df_cm_customers):
     """
 
     # ----------------------------------------------------------------------
-    # STEP 1: Preprocessing – Clean tags and type fields
+    # STEP 1: Preprocessing – Classify contacts (once per pipeline run)
     # ----------------------------------------------------------------------
-    # We ensure the filtering columns in df_contacts are usable:
-    # - Replace null values in 'tags' and 'type' with empty strings
-    # - Convert them to lowercase-safe strings to avoid filter errors
-    df_contacts['tags'] = df_contacts['tags'].fillna('').astype(str)
-    df_contacts['type'] = df_contacts['type'].fillna('').astype(str)
+    # classify_contacts() fills null 'tags'/'type' with empty strings and
+    # lowercases them a single time for all cost tags. run_pipeline passes the
+    # shared result in; standalone calls classify here.
+    if contact_ids is None:
+        contact_ids = classify_contacts(df_contacts)
 
     # ----------------------------------------------------------------------
     # STEP 2: Identify CAC-related suppliers from the Contacts table
     # ----------------------------------------------------------------------
     # Goal: Find all suppliers explicitly tagged for Customer Acquisition Cost (CAC)
-    # - Filter contacts where:
+    # - Contacts where:
     #     • The 'tags' column contains the substring "cac" (case-insensitive)
     #     • The 'type' column equals "supplier"
-    # - Extract and store the 'id' values for these matching contacts
     # - These IDs will be used to match purchases in df_purchases
-    cac_ids = df_contacts[
-        (df_contacts['tags'].str.contains('cac', case=False, na=False)) &
-        (df_contacts['type'].str.lower() == 'supplier')
-    ]['id']
+    cac_ids = contact_ids['cac']
 
     # ----------------------------------------------------------------------
     # STEP 3: Filter Purchases table to retain only CAC-related supplier spend
     # ----------------------------------------------------------------------
-    # - Match df_purchases['contact'] to the CAC supplier IDs extracted in Step 1
-    # - Keep only confirmed purchases ('status' == 1)
-    # - We work on a filtered copy called df_cac_purchases
-    df_cac_purchases = df_purchases[
-        (df_purchases['contact'].isin(cac_ids)) &
-        (df_purchases['status'] == 1)
-    ].copy()
+    # - monthly_supplier_costs() already kept only confirmed purchases ('status' == 1)
+    #   and summed them per month and supplier
+    # - Match its 'contact' to the CAC supplier IDs extracted in Step 2
+    df_cac_purchases = tagged_supplier_costs(df_supplier_costs, cac_ids, df_purchases)
 
     # ----------------------------------------------------------------------
     # STEP 4: Aggregate CAC-related purchases by month
     # ----------------------------------------------------------------------
     if not df_cac_purchases.empty:
-        # 1. Convert purchase dates to 'YYYY-MM' format using ensure_month_format()
-        # 2. Group by month and sum the EUR-normalized 'total_eur' purchase amounts
-        # 3. Rename the resulting column to 'cac_costs' for clarity
-        df_cac_purchases['month'] = ensure_month_format(df_cac_purchases['date'])
+        # 1. Group by month and sum the EUR-normalized 'total_eur' purchase amounts
+        # 2. Rename the resulting column to 'cac_costs' for clarity
         df_cac_costs = (
-            df_cac_purchases
-            .groupby('month', as_index=False)['total_eur']
-            .sum()
+            monthly_sums(df_cac_purchases['month'], df_cac_purchases[['total_eur']])
             .rename(columns={'total_eur': 'cac_costs'})
         )
     else:
@@ -1155,37 +1228,44 @@ def calculate_cac(df_purchases, df_contacts, df_cm_customers):
     # ----------------------------------------------------------------------
     # STEP 5: Count New Customers using ChartMogul 'customer-since'
     # ----------------------------------------------------------------------
-    # - Work on a copy of df_cm_customers to avoid modifying the original
-    # - Drop any rows with missing 'customer-since' (leads, test accounts, etc.)
-    # - Extract the acquisition month using ensure_month_format()
-    # - Group by month and count the number of new unique customer UUIDs
-    df_new_customers = df_cm_customers.copy()
-    df_new_customers = df_new_customers[df_new_customers['customer-since'].notna()]
-    df_new_customers['month'] = ensure_month_format(df_new_customers['customer-since'])
+    # - Drop any rows with missing 'customer-since' or 'uuid' (leads, test accounts, etc.)
+    # - Take the acquisition month (precomputed by run_pipeline when available)
+    # - Only 'month' and 'uuid' are projected into the filtered frame, so
+    #   df_cm_customers is neither copied whole nor modified
+    # - Keep one row per UUID and month, so a plain row count per month gives
+    #   the unique customers without a per-group nunique()
+    has_customer = df_cm_customers['customer-since'].notna() & df_cm_customers['uuid'].notna()
     df_new_customers = (
-        df_new_customers
-        .groupby('month')['uuid']
-        .nunique()
-        .reset_index()
-        .rename(columns={'uuid': 'new_customers'})
+        pd.DataFrame({
+            'month': month_column(df_cm_customers, 'customer-since')[has_customer],
+            'uuid': df_cm_customers['uuid'][has_customer],
+        })
+        .drop_duplicates(['month', 'uuid'])
+        .groupby('month', sort=False, observed=True)
+        .size()
+        .reset_index(name='new_customers')
     )
 
     # ----------------------------------------------------------------------
     # STEP 6: Merge the monthly CAC costs and New Customer counts
     # ----------------------------------------------------------------------
-    # - Perform an outer join on 'month' to ensure no time periods are lost
+    # - Align the two month-indexed summaries (outer) so no time periods are lost
     # - Replace NaNs with 0 (some months may have spend but no new customers, or vice versa)
-    df_cac = pd.merge(df_new_customers, df_cac_costs, on='month', how='outer').fillna(0)
+    df_cac = (
+        pd.concat([df_new_customers.set_index('month'), df_cac_costs.set_index('month')], axis=1, join='outer')
+        .rename_axis('month')
+        .reset_index()
+        .fillna({'new_customers': 0, 'cac_costs': 0})
+    )
 
     # ----------------------------------------------------------------------
     # STEP 7: Compute CAC = CAC Costs / New Customers
     # ----------------------------------------------------------------------
-    # - Row-wise division: only compute CAC if there are new customers that month
-    # - If no new customers, set CAC to 0 to avoid division by zero
-    df_cac['cac'] = df_cac.apply(
-        lambda row: row['cac_costs'] / row['new_customers'] if row['new_customers'] > 0 else 0,
-        axis=1
-    )
+    # - Vectorized division: only compute CAC where there are new customers that month
+    # - If no new customers, CAC stays 0 to avoid division by zero
+    new_customers = df_cac['new_customers'].to_numpy(dtype=float)
+    cac_costs = df_cac['cac_costs'].to_numpy(dtype=float)
+    df_cac['cac'] = np.divide(cac_costs, new_customers, out=np.zeros(len(df_cac)), where=new_customers > 0)
 
     # ----------------------------------------------------------------------
     # STEP 8: Return final DataFrame
@@ -1232,6 +1312,7 @@ def calculate_cac(df_purchases, df_contacts, df_cm_customers):
 #     - Check for months with high LTV and 0 CAC — may indicate insufficient CAC tagging.
 # --------------------------------------------------------------------------
 
+@cached_metric
 def calculate_cac_ltv_ratio(df_ltv, df_cac):
     """
     Calculate the CAC:LTV ratio for each month.
@@ -1258,26 +1339,26 @@ def calculate_cac_ltv_ratio(df_ltv, df_cac):
     """
 
     # ----------------------------------------------------------------------
-    # STEP 1: Merge LTV and CAC data on 'month'
+    # STEP 1: Align LTV and CAC data on 'month'
     # ----------------------------------------------------------------------
-    # Outer join ensures months present in either table are preserved.
+    # Outer alignment on the month index preserves months present in either table.
     # Missing values are filled with 0 for both LTV and CAC.
-    df = pd.merge(
-        df_ltv[['month', 'ltv']],
-        df_cac[['month', 'cac']],
-        on='month',
-        how='outer'
-    ).fillna(0)
+    df = (
+        pd.concat([df_ltv.set_index('month')['ltv'], df_cac.set_index('month')['cac']], axis=1, join='outer')
+        .rename_axis('month')
+        .reset_index()
+        .fillna({'ltv': 0, 'cac': 0})
+    )
 
     # ----------------------------------------------------------------------
     # STEP 2: Calculate CAC:LTV ratio
     # ----------------------------------------------------------------------
     # If CAC > 0, divide LTV by CAC.
     # If CAC == 0, set ratio to 0 to avoid division-by-zero errors.
-    df['cac_ltv_ratio'] = df.apply(
-        lambda row: row['ltv'] / row['cac'] if row['cac'] > 0 else 0,
-        axis=1
-    )
+    # np.divide only divides where CAC > 0 and leaves 0 elsewhere, in one vectorised pass.
+    ltv = df['ltv'].to_numpy(dtype=float)
+    cac = df['cac'].to_numpy(dtype=float)
+    df['cac_ltv_ratio'] = np.divide(ltv, cac, out=np.zeros(len(df)), where=cac > 0)
 
     # ----------------------------------------------------------------------
     # STEP 3: Return final DataFrame
@@ -1334,7 +1415,8 @@ def calculate_cac_ltv_ratio(df_ltv, df_cac):
 #     - Check that months with zero opex actually have no relevant confirmed purchases.
 # --------------------------------------------------------------------------
 
-def calculate_opex(df_purchases, df_contacts):
+@cached_metric
+def calculate_opex(df_purchases, df_contacts, contact_ids=None, df_supplier_costs=None):
     """
     Calculate monthly Operating Expenses (OPEX) from tagged supplier purchases in EUR.
 
@@ -1348,6 +1430,8 @@ def calculate_opex(df_purchases, df_contacts):
             - 'id'          (supplier ID)
             - 'tags'        (classification tags)
             - 'type'        (contact type)
+        contact_ids (dict, optional): Output of classify_contacts(df_contacts)
+        df_supplier_costs (pd.DataFrame, optional): Output of monthly_supplier_costs(df_purchases)
 
     Returns:
         pd.DataFrame: DataFrame with:
@@ -1355,44 +1439,34 @@ def calculate_opex(df_purchases, df_contacts):
             - 'opex'  (float): Sum of confirmed EUR-denominated purchases from opex suppliers
     """
 
-    # --- Ensure the columns used for filtering are in the correct format ---
-    # Fill missing tags/types with empty strings to avoid NaN issues when filtering
-    df_contacts['tags'] = df_contacts['tags'].fillna('').astype(str)
-    df_contacts['type'] = df_contacts['type'].fillna('').astype(str)
+    # --- Classify contacts once (reuses run_pipeline's result when given) ---
+    if contact_ids is None:
+        contact_ids = classify_contacts(df_contacts)
 
     # ----------------------------------------------------------------------
     # STEP 1: Identify OPEX-related suppliers from the Contacts table
     # ----------------------------------------------------------------------
-    # 1. Filter df_contacts for rows where:
+    # 1. classify_contacts() selects df_contacts rows where:
     #    - The 'tags' column contains the keyword "opex" (case-insensitive).
     #    - The 'type' column equals "supplier" (ensuring we only include vendors, not clients).
-    # 2. Extract their 'id' values into a list/Series.
-    opex_ids = df_contacts[
-        (df_contacts['tags'].str.contains('opex', case=False, na=False)) &
-        (df_contacts['type'].str.lower() == 'supplier')
-    ]['id']
+    # 2. Their 'id' values are kept as an array.
+    opex_ids = contact_ids['opex']
 
     # ----------------------------------------------------------------------
     # STEP 2: Filter Purchases table to keep only relevant confirmed OPEX purchases
     # ----------------------------------------------------------------------
     # This step "links" Contacts → Purchases by matching:
-    # - df_purchases['contact'] (supplier ID in the purchase record)
+    # - the supplier ID of the monthly supplier totals
     #   against the `opex_ids` extracted from df_contacts above.
-    # We also require status == 1 to ensure the purchase is confirmed/approved.
-    df_opex_purchases = df_purchases[
-        (df_purchases['contact'].isin(opex_ids)) &   # Supplier is OPEX-tagged
-        (df_purchases['status'] == 1)                # Purchase is confirmed
-    ].copy()
+    # monthly_supplier_costs() only sums purchases with status == 1 (confirmed/approved).
+    df_opex_purchases = tagged_supplier_costs(df_supplier_costs, opex_ids, df_purchases)
 
     # ----------------------------------------------------------------------
     # STEP 3: Aggregate total OPEX per month
     # ----------------------------------------------------------------------
     if not df_opex_purchases.empty:
-        # Convert purchase date into YYYY-MM format for monthly grouping
-        df_opex_purchases['month'] = ensure_month_format(df_opex_purchases['date'])
-
         # Sum the EUR purchase amounts ('total_eur') for each month
-        df_opex = df_opex_purchases.groupby('month', as_index=False)['total_eur'].sum()
+        df_opex = monthly_sums(df_opex_purchases['month'], df_opex_purchases[['total_eur']])
 
         # Rename the column to 'opex' to indicate metric meaning
         df_opex.rename(columns={'total_eur': 'opex'}, inplace=True)
@@ -1456,7 +1530,8 @@ def calculate_opex(df_purchases, df_contacts):
 #     - Check that months with zero COGS actually have no relevant confirmed purchases.
 # --------------------------------------------------------------------------
 
-def calculate_cogs(df_purchases, df_contacts):
+@cached_metric
+def calculate_cogs(df_purchases, df_contacts, contact_ids=None, df_supplier_costs=None):
     """
     Calculate monthly Cost of Goods Sold (COGS) from tagged supplier purchases in EUR.
 
@@ -1470,6 +1545,8 @@ def calculate_cogs(df_purchases, df_contacts):
             - 'id'          (supplier ID)
             - 'tags'        (classification tags)
             - 'type'        (contact type)
+        contact_ids (dict, optional): Output of classify_contacts(df_contacts)
+        df_supplier_costs (pd.DataFrame, optional): Output of monthly_supplier_costs(df_purchases)
 
     Returns:
         pd.DataFrame: DataFrame with:
@@ -1477,41 +1554,32 @@ def calculate_cogs(df_purchases, df_contacts):
             - 'cogs'  (float): Sum of confirmed EUR-denominated purchases from cogs suppliers
     """
 
-    # --- Ensure the columns used for filtering are in the correct format ---
-    # Fill missing tags/types with empty strings to avoid NaN issues when filtering
-    df_contacts['tags'] = df_contacts['tags'].fillna('').astype(str)
-    df_contacts['type'] = df_contacts['type'].fillna('').astype(str)
+    # --- Classify contacts once (reuses run_pipeline's result when given) ---
+    if contact_ids is None:
+        contact_ids = classify_contacts(df_contacts)
 
     # ----------------------------------------------------------------------
     # STEP 1: Identify COGS-related suppliers from the Contacts table
     # ----------------------------------------------------------------------
-    # 1. Filter df_contacts for rows where:
+    # 1. classify_contacts() selects df_contacts rows where:
     #    - The 'tags' column contains the keyword "cogs" (case-insensitive).
     #    - The 'type' column equals "supplier".
-    # 2. Extract their 'id' values for purchase filtering.
-    cogs_ids = df_contacts[
-        (df_contacts['tags'].str.contains('cogs', case=False, na=False)) &
-        (df_contacts['type'].str.lower() == 'supplier')
-    ]['id']
+    # 2. Their 'id' values are used for purchase filtering.
+    cogs_ids = contact_ids['cogs']
 
     # ----------------------------------------------------------------------
     # STEP 2: Filter Purchases table for matching confirmed COGS purchases
     # ----------------------------------------------------------------------
-    # Filter df_purchases to only:
+    # Filter the monthly supplier totals to only:
     #   - Purchases linked to COGS-tagged suppliers
-    #   - Purchases marked as confirmed (status == 1)
-    df_cogs_purchases = df_purchases[
-        (df_purchases['contact'].isin(cogs_ids)) &
-        (df_purchases['status'] == 1)
-    ].copy()
+    #   - Purchases marked as confirmed (status == 1, applied by monthly_supplier_costs)
+    df_cogs_purchases = tagged_supplier_costs(df_supplier_costs, cogs_ids, df_purchases)
 
     # ----------------------------------------------------------------------
     # STEP 3: Aggregate COGS totals by month
     # ----------------------------------------------------------------------
     if not df_cogs_purchases.empty:
-        df_cogs_purchases['month'] = ensure_month_format(df_cogs_purchases['date'])
-
-        df_cogs = df_cogs_purchases.groupby('month', as_index=False)['total_eur'].sum()
+        df_cogs = monthly_sums(df_cogs_purchases['month'], df_cogs_purchases[['total_eur']])
         df_cogs.rename(columns={'total_eur': 'cogs'}, inplace=True)
     else:
         debug("No confirmed COGS purchases found. Defaulting to 0.")
@@ -1572,7 +1640,8 @@ def calculate_cogs(df_purchases, df_contacts):
 #     - Ensure consistent formatting of "costes financieros" in supplier tags.
 # --------------------------------------------------------------------------
 
-def calculate_financial_costs(df_purchases, df_contacts):
+@cached_metric
+def calculate_financial_costs(df_purchases, df_contacts, contact_ids=None, df_supplier_costs=None):
     """
     Calculate monthly Financial Costs from tagged supplier purchases in EUR.
 
@@ -1586,6 +1655,8 @@ def calculate_financial_costs(df_purchases, df_contacts):
             - 'id'          (supplier ID)
             - 'tags'        (classification tags)
             - 'type'        (contact type)
+        contact_ids (dict, optional): Output of classify_contacts(df_contacts)
+        df_supplier_costs (pd.DataFrame, optional): Output of monthly_supplier_costs(df_purchases)
 
     Returns:
         pd.DataFrame: DataFrame with:
@@ -1593,36 +1664,27 @@ def calculate_financial_costs(df_purchases, df_contacts):
             - 'financial_costs' (float): Sum of confirmed EUR-denominated purchases from financial suppliers
     """
 
-    # --- Prepare contacts data for filtering ---
-    # Ensure 'tags' and 'type' columns are strings and not NaN
-    df_contacts['tags'] = df_contacts['tags'].fillna('').astype(str)
-    df_contacts['type'] = df_contacts['type'].fillna('').astype(str)
+    # --- Classify contacts once (reuses run_pipeline's result when given) ---
+    if contact_ids is None:
+        contact_ids = classify_contacts(df_contacts)
 
     # ----------------------------------------------------------------------
     # STEP 1: Identify Financial Costs suppliers from the Contacts table
     # ----------------------------------------------------------------------
-    # Filter to suppliers whose 'tags' contain "costes financieros"
+    # Suppliers whose 'tags' contain "costes financieros"
     # (case-insensitive match) and whose 'type' is "supplier".
-    fin_cost_ids = df_contacts[
-        (df_contacts['tags'].str.contains('costes financieros', case=False, na=False)) &
-        (df_contacts['type'].str.lower() == 'supplier')
-    ]['id']
+    fin_cost_ids = contact_ids['financial_costs']
 
     # ----------------------------------------------------------------------
     # STEP 2: Filter Purchases for these suppliers (confirmed only)
     # ----------------------------------------------------------------------
-    df_fin_cost_purchases = df_purchases[
-        (df_purchases['contact'].isin(fin_cost_ids)) &
-        (df_purchases['status'] == 1)
-    ].copy()
+    df_fin_cost_purchases = tagged_supplier_costs(df_supplier_costs, fin_cost_ids, df_purchases)
 
     # ----------------------------------------------------------------------
     # STEP 3: Aggregate Financial Costs by month
     # ----------------------------------------------------------------------
     if not df_fin_cost_purchases.empty:
-        df_fin_cost_purchases['month'] = ensure_month_format(df_fin_cost_purchases['date'])
-
-        df_fin_costs = df_fin_cost_purchases.groupby('month', as_index=False)['total_eur'].sum()
+        df_fin_costs = monthly_sums(df_fin_cost_purchases['month'], df_fin_cost_purchases[['total_eur']])
         df_fin_costs.rename(columns={'total_eur': 'financial_costs'}, inplace=True)
     else:
         debug("No confirmed Financial Costs purchases found. Defaulting to 0.")
@@ -1686,6 +1748,7 @@ def calculate_financial_costs(df_purchases, df_contacts):
 #     - Compare EBITDA trend against historical financial reports if available.
 # --------------------------------------------------------------------------
 
+@cached_metric
 def calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac):
     """
     Calculate monthly EBITDA (Earnings Before Interest, Taxes, Depreciation, and Amortization)
@@ -1718,17 +1781,17 @@ def calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac):
     """
 
     # ----------------------------------------------------------------------
-    # STEP 1: Merge all input DataFrames on 'month'
+    # STEP 1: Align all input DataFrames on 'month'
     # ----------------------------------------------------------------------
-    # Outer join ensures that months present in any of the datasets are kept.
+    # One outer concat on the month index keeps months present in any of the
+    # datasets (instead of a chain of four merges, each building a new frame).
     # fillna(0) ensures missing values are treated as zero costs/revenue.
+    frames = [df_mrr, df_opex, df_cogs, df_financial_costs, df_cac[['month', 'cac_costs']]]
     df = (
-        df_mrr
-        .merge(df_opex, on='month', how='outer')
-        .merge(df_cogs, on='month', how='outer')
-        .merge(df_financial_costs, on='month', how='outer')
-        .merge(df_cac[['month', 'cac_costs']], on='month', how='outer')
-        .fillna(0)
+        pd.concat([frame.set_index('month') for frame in frames], axis=1, join='outer')
+        .rename_axis('month')
+        .reset_index()
+        .fillna({'mrr': 0, 'opex': 0, 'cogs': 0, 'financial_costs': 0, 'cac_costs': 0})
     )
 
     # ----------------------------------------------------------------------
@@ -1771,7 +1834,7 @@ def calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac):
 #     1. From purchases: filter for confirmed rows (status == 1)
 #     2. Convert 'date' to month (YYYY-MM) and sum 'total_eur' per month
 #     3. From MRR: group by 'date' and sum 'mrr' per month
-#     4. Merge revenue and costs on 'month'
+#     4. Align revenue and costs on 'month'
 #     5. Calculate: net_burn = total_costs - mrr
 #
 # * Assumptions:
@@ -1784,7 +1847,8 @@ def calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac):
 #     - Months with missing MRR or costs should default to 0 before subtraction
 # --------------------------------------------------------------------------
 
-def calculate_net_burn(df_purchases, df_cm_mrr_components):
+@cached_metric
+def calculate_net_burn(df_purchases, df_cm_mrr_components, df_supplier_costs=None):
     """
     Calculate monthly Net Burn Rate = total confirmed EUR costs - MRR revenue.
 
@@ -1796,6 +1860,7 @@ def calculate_net_burn(df_purchases, df_cm_mrr_components):
         df_cm_mrr_components (pd.DataFrame): ChartMogul MRR components with:
             - 'date'        (YYYY-MM string)
             - 'mrr'         (monthly recurring revenue)
+        df_supplier_costs (pd.DataFrame, optional): Output of monthly_supplier_costs(df_purchases)
 
     Returns:
         pd.DataFrame: DataFrame with:
@@ -1807,34 +1872,32 @@ def calculate_net_burn(df_purchases, df_cm_mrr_components):
     # ----------------------------------------------------------------------
     # STEP 1: Calculate Total Confirmed Costs per Month (EUR)
     # ----------------------------------------------------------------------
-    df_confirmed = df_purchases[df_purchases['status'] == 1].copy()
-    df_confirmed['month'] = ensure_month_format(df_confirmed['date'])
+    # Re-aggregates the per-supplier monthly totals (confirmed purchases only)
+    if df_supplier_costs is None:
+        df_supplier_costs = monthly_supplier_costs(df_purchases)
 
-    df_costs = df_confirmed.groupby('month', as_index=False)['total_eur'].sum()
-    df_costs.rename(columns={'total_eur': 'total_costs'}, inplace=True)
+    costs = monthly_sums(df_supplier_costs['month'], df_supplier_costs[['total_eur']]).set_index('month')['total_eur']
 
     # ----------------------------------------------------------------------
     # STEP 2: Aggregate Monthly MRR from CM data
     # ----------------------------------------------------------------------
-    df_revenue = df_cm_mrr_components.copy()
-    df_revenue['month'] = ensure_month_format(df_revenue['date'])
-    df_revenue = df_revenue.groupby('month', as_index=False)['mrr'].sum()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Merge Costs and Revenue, Fill Missing Values
-    # ----------------------------------------------------------------------
-    df_merged = pd.merge(df_costs, df_revenue, on='month', how='outer')
-    df_merged.fillna({'total_costs': 0, 'mrr': 0}, inplace=True)
+    revenue = monthly_sums(month_column(df_cm_mrr_components, 'date'), df_cm_mrr_components[['mrr']]).set_index('month')['mrr']
 
     # ----------------------------------------------------------------------
-    # STEP 4: Calculate Net Burn
+    # STEP 3: Calculate Net Burn on the aligned months
     # ----------------------------------------------------------------------
-    df_merged['net_burn'] = df_merged['total_costs'] - df_merged['mrr']
+    # sub(fill_value=0) aligns both month-indexed Series (outer) and treats a
+    # month missing on either side as 0, without a merge + fillna frame.
+    net_burn = costs.sub(revenue, fill_value=0)
 
     # ----------------------------------------------------------------------
-    # STEP 5: Return final DataFrame
+    # STEP 4: Return final DataFrame
     # ----------------------------------------------------------------------
-    return df_merged[['month', 'total_costs', 'net_burn']]
+    return pd.DataFrame({
+        'month': net_burn.index,
+        'total_costs': costs.reindex(net_burn.index, fill_value=0).to_numpy(),
+        'net_burn': net_burn.to_numpy(),
+    })
 
 
 # --------------------------------------------------------------------------
@@ -1868,6 +1931,7 @@ def calculate_net_burn(df_purchases, df_cm_mrr_components):
 #     - Positive EBITDA but positive burn_rate should be clearly explained in reporting.
 # --------------------------------------------------------------------------
 
+@cached_metric
 def calculate_burn_rate(df_ebitda):
     """
     Calculate the monthly Burn Rate from EBITDA.
@@ -1892,21 +1956,15 @@ def calculate_burn_rate(df_ebitda):
     """
 
     # ----------------------------------------------------------------------
-    # STEP 1: Work on a copy to avoid mutating the input DataFrame
-    # ----------------------------------------------------------------------
-    df = df_ebitda.copy()
-
-    # ----------------------------------------------------------------------
-    # STEP 2: Calculate burn rate as the absolute value of EBITDA
+    # STEP 1: Calculate burn rate as the absolute value of EBITDA
     # ----------------------------------------------------------------------
     # Even if EBITDA is positive, we report burn_rate as a positive number.
     # This normalizes reporting for both profit and loss months.
-    df['burn_rate'] = df['ebitda'].abs()
-
-    # ----------------------------------------------------------------------
-    # STEP 3: Return the final DataFrame
-    # ----------------------------------------------------------------------
-    return df[['month', 'burn_rate']]
+    # The result is a new two-column frame, so the input is never copied or mutated.
+    return pd.DataFrame({
+        'month': df_ebitda['month'],
+        'burn_rate': np.fabs(df_ebitda['ebitda'].to_numpy(dtype=float)),
+    })
 
 # --------------------------------------------------------------------------
 # 21. Runway (runway, cash_balance_eur)
@@ -1972,7 +2030,7 @@ def calculate_runway(df_burn_rate, cash_or_df):
     # ----------------------------------------------------------------------
     # STEP 1: Work on a copy and normalize 'month'
     # ----------------------------------------------------------------------
-    df = df_burn_rate.copy()
+    df = df_burn_rate.copy(deep=False)
     df['month'] = ensure_month_format(df['month'])
     df['burn_rate'] = pd.to_numeric(df['burn_rate'], errors='coerce').fillna(0.0)
 
@@ -1982,7 +2040,7 @@ def calculate_runway(df_burn_rate, cash_or_df):
     if isinstance(cash_or_df, (int, float)):                     # constant cash path
         df['cash_balance_eur'] = float(cash_or_df or 0)
     else:                                                         # DataFrame path
-        cash = cash_or_df.copy()
+        cash = cash_or_df.copy(deep=False)
         # Pick month column and ensure required fields exist
         month_col = 'month' if 'month' in cash.columns else ('date' if 'date' in cash.columns else None)
         if month_col is None:
@@ -1996,27 +2054,34 @@ def calculate_runway(df_burn_rate, cash_or_df):
             if 'cash_balance_eur' not in cash.columns:
                 raise ValueError("df_cash_balance must include 'cash_balance_eur' (or a recognizable balance column).")
 
-        # Normalize to YYYY-MM and aggregate to monthly (month-end by .last())
-        cash['month'] = ensure_month_format(cash[month_col])
-        cash['cash_balance_eur'] = pd.to_numeric(cash['cash_balance_eur'], errors='coerce')
-        cash = (
-            cash[['month', 'cash_balance_eur']]
-            .groupby('month', as_index=False)['cash_balance_eur']
-            .last()
-        )
-
-        # Merge monthly cash into burn-rate table
-        df = pd.merge(df, cash, on='month', how='outer')
+        # Aggregate to monthly (month-end by .last()) with a datetime-aware
+        # resample on the sorted dates, then label each month as YYYY-MM.
+        # Only months that have treasury rows are kept (no empty resample bins).
+        dates = cash[month_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce', format='ISO8601')
+        balances = pd.Series(
+            pd.to_numeric(cash['cash_balance_eur'], errors='coerce').to_numpy(), index=dates
+        ).loc[dates.notna().to_numpy()].sort_index(kind='stable').resample('ME')
+        month_end = balances.last()[balances.size() > 0]
+        cash = pd.DataFrame({
+            'month': month_end.index.to_period('M').astype(str),
+            'cash_balance_eur': month_end.to_numpy(),
+        })
+
+        # Merge monthly cash into burn-rate table; both sides hold one row per
+        # month, which validate= enforces (a duplicate month would fan out rows)
+        df = pd.merge(df, cash, on='month', how='outer', validate='one_to_one')
         df['cash_balance_eur'] = df['cash_balance_eur'].fillna(0.0)
 
     # ----------------------------------------------------------------------
     # STEP 3: Calculate Runway (months)
     # ----------------------------------------------------------------------
-    # Avoid division by zero: set runway to None if burn_rate is 0
-    df['runway'] = df.apply(
-        lambda row: round(row['cash_balance_eur'] / row['burn_rate'], 2) if row['burn_rate'] != 0 else None,
-        axis=1
-    )
+    # Avoid division by zero: leave runway empty (NaN) if burn_rate is 0
+    burn_rate = df['burn_rate'].to_numpy(dtype=float)
+    cash_balance = df['cash_balance_eur'].to_numpy(dtype=float)
+    runway = np.divide(cash_balance, burn_rate, out=np.full(len(df), np.nan), where=burn_rate != 0)
+    df['runway'] = np.round(runway, 2)
 
     # ----------------------------------------------------------------------
     # STEP 4: Return final DataFrame
@@ -2024,14 +2089,17 @@ def calculate_runway(df_burn_rate, cash_or_df):
     return df[['month', 'cash_balance_eur', 'runway']]
 
 # ------------------- Main Pipeline -------------------
-def run_pipeline(cash_balance):
+def run_pipeline(cash_balance, summary=True):
+    # Fingerprint of the inputs, passed to every cached metric below
+    cache_key = inputs_fingerprint()
+
     debug("Loading input datasets...")
-    df_customers_raw = pd.read_csv('data/INPUT/chartmogul_customers/clean/chartmogul_customers_clean.csv')
-    df_purchases = pd.read_csv('data/INPUT/holded_purchases/clean/holded_purchases_clean.csv')
-    df_contacts = pd.read_csv('data/INPUT/holded_contacts/clean/holded_contacts_clean.csv')
-    df_mrr_components = pd.read_csv('data/INPUT/chartmogul_mrr_components/clean/chartmogul_mrr_components_clean.csv')
-    df_cm_metrics = pd.read_csv('data/INPUT/chartmogul_metrics/clean/chartmogul_metrics_clean.csv')
-    df_treasury = pd.read_csv('data/INPUT/holded_treasury/clean/holded_treasury_clean.csv')
+    df_customers_raw = load_input('customers')
+    df_purchases = load_input('purchases')
+    df_contacts = load_input('contacts')
+    df_mrr_components = load_input('mrr_components')
+    df_cm_metrics = load_input('cm_metrics')
+    df_treasury = load_input('treasury')
 
     # Normalize common treasury balance column names to 'cash_balance_eur' (optional but helpful)
     if 'cash_balance_eur' not in df_treasury.columns:
@@ -2044,27 +2112,63 @@ def run_pipeline(cash_balance):
     validate_columns(df_contacts, ['id', 'tags'], "Contacts")
     validate_columns(df_purchases, ['date', 'contact', 'total'], "Purchases")
 
+    # Parse each input's dates to 'month' once; the metrics below reuse it via month_column()
+    for df, date_col in [
+        (df_purchases, 'date'),
+        (df_customers_raw, 'customer-since'),
+        (df_mrr_components, 'date'),
+        (df_cm_metrics, 'month_start'),
+    ]:
+        df['month'] = ensure_month_period(df[date_col])
+
+    # Key every frame on one shared, ordered categorical 'month' so groupbys and
+    # merges hash small integer codes instead of 'YYYY-MM' strings. The codes
+    # come straight from the Period ordinals; only the category labels are strings.
+    months = month_dtype(df_purchases['month'], df_customers_raw['month'],
+                         df_mrr_components['month'], df_cm_metrics['month'])
+    for df in (df_purchases, df_customers_raw, df_mrr_components, df_cm_metrics):
+        df['month'] = period_to_month(df['month'], months)
+
+    # Scan contact tags once for every tag-based cost metric (13, 15-17).
+    # On an Arrow-backed 'contact' column the four isin() lookups run as
+    # pyarrow.compute.is_in hash probes instead of per-object Python hashing.
+    contact_ids = classify_contacts(df_contacts)
+    df_purchases['contact'] = arrow_strings(df_purchases['contact'])
+
+    # Single pass over purchases: confirmed EUR totals per month and supplier,
+    # shared by CAC, OPEX, COGS, financial costs and net burn (13, 15-17, 19)
+    df_supplier_costs = monthly_supplier_costs(df_purchases)
+
     # --- Compute metrics in script order ---
-    df_mrr = calculate_mrr(df_mrr_components)                                           # 1
-    df_expansion_mrr = calculate_expansion_mrr(df_mrr_components)                       # 2
-    df_contraction_mrr = calculate_contraction_mrr(df_mrr_components)                   # 3
-    df_new_mrr = calculate_new_mrr(df_mrr_components)                                   # 4
-    df_churned_mrr = calculate_churned_mrr(df_mrr_components)                           # 5
-    df_net_new_mrr = calculate_net_new_mrr(df_mrr_components)                           # 6
-    df_arr = calculate_arr(df_mrr_components)                                           # 7
-    df_arpa = calculate_arpa(df_cm_metrics)                                             # 8
-    df_customers = calculate_customers(df_cm_metrics)                                   # 9
-    df_customer_churn_rate = calculate_customer_churn_rate(df_cm_metrics)               # 10
-    df_revenue_churn_rate = calculate_revenue_churn_rate(df_cm_metrics)                 # 11
-    df_ltv = calculate_ltv(df_cm_metrics)                                               # 12
-    df_cac = calculate_cac(df_purchases, df_contacts, df_customers_raw)                 # 13  <-- FIX
-    df_cac_ltv_ratio = calculate_cac_ltv_ratio(df_ltv, df_cac)                          # 14
-    df_opex = calculate_opex(df_purchases, df_contacts)                                 # 15
-    df_cogs = calculate_cogs(df_purchases, df_contacts)                                 # 16
-    df_financial_costs = calculate_financial_costs(df_purchases, df_contacts)           # 17
-    df_ebitda = calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac)  # 18
-    df_net_burn = calculate_net_burn(df_purchases, df_mrr_components)                   # 19
-    df_burn_rate = calculate_burn_rate(df_ebitda)                                       # 20
+    df_mrr_bundle = calculate_mrr_bundle(df_mrr_components, cache_key=cache_key)        # 1-7
+    df_mrr = calculate_mrr(df_mrr_components, df_mrr_bundle)                            # 1
+    df_expansion_mrr = calculate_expansion_mrr(df_mrr_components, df_mrr_bundle)        # 2
+    df_contraction_mrr = calculate_contraction_mrr(df_mrr_components, df_mrr_bundle)    # 3
+    df_new_mrr = calculate_new_mrr(df_mrr_components, df_mrr_bundle)                    # 4
+    df_churned_mrr = calculate_churned_mrr(df_mrr_components, df_mrr_bundle)            # 5
+    df_net_new_mrr = calculate_net_new_mrr(df_mrr_components, df_mrr_bundle)            # 6
+    df_arr = calculate_arr(df_mrr_components, df_mrr_bundle)                            # 7
+    df_cm_bundle = calculate_cm_bundle(df_cm_metrics, cache_key=cache_key)              # 8-12
+    df_arpa = calculate_arpa(df_cm_metrics, df_cm_bundle)                               # 8
+    df_customers = calculate_customers(df_cm_metrics, df_cm_bundle)                     # 9
+    df_customer_churn_rate = calculate_customer_churn_rate(df_cm_metrics, df_cm_bundle) # 10
+    df_revenue_churn_rate = calculate_revenue_churn_rate(df_cm_metrics, df_cm_bundle)   # 11
+    df_ltv = calculate_ltv(df_cm_metrics, df_cm_bundle)                                 # 12
+    df_cac = calculate_cac(df_purchases, df_contacts, df_customers_raw,
+                           contact_ids, df_supplier_costs, cache_key=cache_key)     # 13  <-- FIX
+    df_cac_ltv_ratio = calculate_cac_ltv_ratio(df_ltv, df_cac, cache_key=cache_key)     # 14
+    df_opex = calculate_opex(df_purchases, df_contacts, contact_ids, df_supplier_costs,
+                             cache_key=cache_key)                                       # 15
+    df_cogs = calculate_cogs(df_purchases, df_contacts, contact_ids, df_supplier_costs,
+                             cache_key=cache_key)                                       # 16
+    df_financial_costs = calculate_financial_costs(df_purchases, df_contacts,
+                                                   contact_ids, df_supplier_costs,
+                                                   cache_key=cache_key)             # 17
+    df_ebitda = calculate_ebitda(df_mrr, df_opex, df_cogs, df_financial_costs, df_cac,
+                                 cache_key=cache_key)                                   # 18
+    df_net_burn = calculate_net_burn(df_purchases, df_mrr_components, df_supplier_costs,
+                                     cache_key=cache_key)                               # 19
+    df_burn_rate = calculate_burn_rate(df_ebitda, cache_key=cache_key)                  # 20
 
     # Use treasury DF if available; otherwise fall back to the CLI constant
     cash_source = df_treasury if not df_treasury.empty else cash_balance
@@ -2096,17 +2200,16 @@ def run_pipeline(cash_balance):
         df_runway                       # 21
     ]
 
-    df_final = dfs[0]
-    for df in dfs[1:]:
-        df_final = pd.merge(df_final, df, on='month', how='outer')
-
-    df_final = df_final.loc[:, ~df_final.columns.duplicated()]
-    df_final = df_final.fillna(0)
-    df_final['month'] = pd.to_datetime(df_final['month'], format="%Y-%m")
-    df_final = df_final.sort_values(by='month')
-    df_final['month'] = df_final['month'].dt.strftime("%Y-%m")
+    # Every metric has one row per month, so align them all on a 'month' index
+    # in a single outer concat instead of a chain of pairwise merges.
+    # Each metric owns distinct column names; verify_integrity raises if two clash.
+    df_final = pd.concat([df.set_index('month') for df in dfs], axis=1, join='outer', verify_integrity=True)
+    df_final = df_final.rename_axis('month').reset_index()
 
     # --- Reorder columns in script order ---
+    # Done once, right after the concat, so helper columns outside
+    # preferred_order (e.g. net burn's total_costs) are dropped before the
+    # fill and sort below instead of being carried through them.
     preferred_order = [
         'month', 'mrr', 'expansion_mrr', 'contraction_mrr', 'new_mrr', 'churned_mrr',
         'net_new_mrr', 'arr',
@@ -2117,8 +2220,13 @@ def run_pipeline(cash_balance):
         'ebitda', 'burn_rate', 'net_burn', 'cash_balance_eur', 'runway'
     ]
 
-    ordered_columns = [col for col in preferred_order if col in df_final.columns]
-    df_final = df_final[ordered_columns]
+    df_final = df_final.reindex(columns=[col for col in preferred_order if col in df_final.columns])
+
+    metric_cols = df_final.columns.drop('month')
+    df_final[metric_cols] = df_final[metric_cols].fillna(0)
+    # 'YYYY-MM' strings sort chronologically as-is, no datetime round-trip needed
+    df_final['month'] = df_final['month'].astype(str)
+    df_final = df_final.sort_values(by='month', kind='mergesort')
 
     # --- Save outputs ---
     current_month = datetime.now().strftime("%Y-%m")
@@ -2130,23 +2238,25 @@ def run_pipeline(cash_balance):
     parquet_path = os.path.join(output_dir, f"final_metrics_{current_month}.parquet")
 
     # Save monthly files
-    df_final.to_csv(csv_path, index=False)
+    save_csv(df_final, csv_path)
     save_parquet(df_final, parquet_path)
     debug(f"Metrics saved at {csv_path} and {parquet_path}")
 
-    # Save summary stats
-    summary_stats = df_final.describe().round(2)
-    summary_path = os.path.join(output_dir, f"summary_stats_{current_month}.csv")
-    summary_stats.to_csv(summary_path)
-    debug(f"Summary saved at {summary_path}")
+    # Save summary stats (skip with --no-summary; numeric metric columns only)
+    if summary:
+        summary_stats = df_final.select_dtypes(include=[np.number]).describe().round(2)
+        summary_path = os.path.join(output_dir, f"summary_stats_{current_month}.csv")
+        summary_stats.to_csv(summary_path)
+        debug(f"Summary saved at {summary_path}")
 
     # --- Save static "latest" version for Power BI or external use ---
     latest_csv = os.path.join("data", "OUTPUT", "final_metrics_latest.csv")
     latest_parquet = os.path.join("data", "OUTPUT", "final_metrics_latest.parquet")
 
-    # Overwrite static files with current month's data
-    df_final.to_csv(latest_csv, index=False)
-    save_parquet(df_final, latest_parquet)
+    # Overwrite static files with current month's data (byte copies of the
+    # files just written, so df_final is only serialized once per format)
+    shutil.copyfile(csv_path, latest_csv)
+    shutil.copyfile(parquet_path, latest_parquet)
     debug(f"Static latest metrics saved at {latest_csv} and {latest_parquet}")
 
 
@@ -2154,5 +2264,7 @@ def run_pipeline(cash_balance):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--cash", type=float, default=10000)
+    parser.add_argument("--no-summary", dest="summary", action="store_false",
+                        help="Skip writing summary_stats_<month>.csv")
     args = parser.parse_args()
-    run_pipeline(cash_balance=args.cash)
+    run_pipeline(cash_balance=args.cash, summary=args.summary)
@@ -16,6 +16,7 @@
 # 🔹 Features:
 #     - Modular and centralized script orchestration
 #     - Subprocess execution for isolation
+#     - Independent sources (extract -> transform chains) run concurrently
 #     - Color-coded console feedback and file-based logging
 #     - Compatible with automation and scheduling tools (e.g., GitHub Actions, Airflow)
 # ================================================================
@@ -24,7 +25,9 @@ import subprocess
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # ================================================================
 # LOGGING SETUP
@@ -44,36 +47,53 @@ YELLOW = "\033[93m"
 RESET = "\033[0m"
 
 # ================================================================
-# SCRIPT LIST (ORDERED)
+# SCRIPT CHAINS (ORDERED WITHIN EACH CHAIN)
 # ================================================================
+# Each chain is one source: its transform only depends on its own extract.
+# Extracts are network-bound API pulls, so the chains run concurrently and
+# one slow API no longer holds up the others. The daily ledger transform
+# anchors balances on the treasury snapshot (holded_treasury_raw.json), so
+# the treasury extract runs in that chain before the transform.
 
-scripts = [
+script_chains = [
     # ChartMogul
-    "data_pipeline/CM/Extract/extract_CM_customers.py",
-    "data_pipeline/CM/Transform/transform_CM_customers.py",
-    "data_pipeline/CM/Extract/extract_CM_metrics.py",
-    "data_pipeline/CM/Transform/transform_CM_metrics.py",
-    "data_pipeline/CM/Extract/extract_CM_plans.py",
-    "data_pipeline/CM/Transform/transform_CM_plans.py",
-    "data_pipeline/CM/Extract/extract_CM_mrr_components.py",
-    "data_pipeline/CM/Transform/transform_CM_mrr_components.py",
+    ["data_pipeline/CM/Extract/extract_CM_customers.py",
+     "data_pipeline/CM/Transform/transform_CM_customers.py"],
+    ["data_pipeline/CM/Extract/extract_CM_metrics.py",
+     "data_pipeline/CM/Transform/transform_CM_metrics.py"],
+    ["data_pipeline/CM/Extract/extract_CM_plans.py",
+     "data_pipeline/CM/Transform/transform_CM_plans.py"],
+    ["data_pipeline/CM/Extract/extract_CM_mrr_components.py",
+     "data_pipeline/CM/Transform/transform_CM_mrr_components.py"],
 
     # Holded
-    "data_pipeline/HD/Extract/extract_HD_invoices.py",
-    "data_pipeline/HD/Transform/transform_HD_invoices.py",
-    "data_pipeline/HD/Extract/extract_HD_payments.py",
-    "data_pipeline/HD/Transform/transform_HD_payments.py",
-    "data_pipeline/HD/Extract/extract_HD_contacts.py",
-    "data_pipeline/HD/Transform/transform_HD_contacts.py",
-    "data_pipeline/HD/Extract/extract_HD_expenses.py",
-    "data_pipeline/HD/Transform/transform_HD_expenses.py",
-    "data_pipeline/HD/Extract/extract_HD_purchases.py",
-    "data_pipeline/HD/Transform/transform_HD_purchases.py",
-    "data_pipeline/HD/Extract/extract_HD_daily_ledger.py",
-    "data_pipeline/HD/Transform/transform_HD_daily_ledger.py",
-    "data_pipeline/HD/Extract/extract_HD_treasury.py",
+    ["data_pipeline/HD/Extract/extract_HD_invoices.py",
+     "data_pipeline/HD/Transform/transform_HD_invoices.py"],
+    ["data_pipeline/HD/Extract/extract_HD_payments.py",
+     "data_pipeline/HD/Transform/transform_HD_payments.py"],
+    ["data_pipeline/HD/Extract/extract_HD_contacts.py",
+     "data_pipeline/HD/Transform/transform_HD_contacts.py"],
+    ["data_pipeline/HD/Extract/extract_HD_expenses.py",
+     "data_pipeline/HD/Transform/transform_HD_expenses.py"],
+    ["data_pipeline/HD/Extract/extract_HD_purchases.py",
+     "data_pipeline/HD/Transform/transform_HD_purchases.py"],
+    ["data_pipeline/HD/Extract/extract_HD_daily_ledger.py",
+     "data_pipeline/HD/Extract/extract_HD_treasury.py",
+     "data_pipeline/HD/Transform/transform_HD_daily_ledger.py"],
 ]
 
+# Each API's extracts share one key and its rate limit, so at most this many
+# extracts per API call it at once; the other chains queue for a slot.
+# Transforms are local and never wait.
+MAX_CONCURRENT_EXTRACTS_PER_API = 2
+extract_slots = {
+    "/CM/Extract/": threading.BoundedSemaphore(MAX_CONCURRENT_EXTRACTS_PER_API),  # ChartMogul
+    "/HD/Extract/": threading.BoundedSemaphore(MAX_CONCURRENT_EXTRACTS_PER_API),  # Holded
+}
+
+# Flat list in the original run order (used to order the summary)
+scripts = [script for chain in script_chains for script in chain]
+
 # ================================================================
 # REQUIRED OUTPUT FILES
 # ================================================================
@@ -99,7 +119,7 @@ def run_script(script):
         logging.warning(f"Script not found: {script}")
         print(f"{YELLOW} Script not found: {script}{RESET}")
         results.append((script, "NOT FOUND", 0))
-        return
+        return "NOT FOUND"
 
     try:
         logging.info(f"Running {script}")
@@ -121,6 +141,7 @@ def run_script(script):
             if result.stdout:
                 print(f"{YELLOW}--- STDOUT ---\n{result.stdout}{RESET}")
             results.append((script, "SUCCESS", elapsed))
+            return "SUCCESS"
         else:
             logging.error(f"Failed: {script} — {result.stderr}")
             print(f"{RED} Failed: {script} ({elapsed}s){RESET}")
@@ -129,11 +150,26 @@ def run_script(script):
             if result.stderr:
                 print(f"{RED}--- STDERR ---\n{result.stderr}{RESET}")
             results.append((script, "FAILED", elapsed))
+            return "FAILED"
     except subprocess.CalledProcessError as e:
         elapsed = round(time.time() - start_time, 2)
         logging.error(f"Failed: {script} — {e}")
         print(f"{RED} Failed: {script} ({elapsed}s){RESET}")
         results.append((script, "FAILED", elapsed))
+        return "FAILED"
+
+def run_chain(chain):
+    """Run one source's scripts in order, stopping the chain at its first failure."""
+    for script in chain:
+        slots = next((slots for api, slots in extract_slots.items() if api in script), None)
+        if slots is not None:
+            with slots:
+                status = run_script(script)
+        else:
+            status = run_script(script)
+        if status == "FAILED":
+            return script
+    return None
 
 # ================================================================
 # MAIN EXECUTION
@@ -143,12 +179,18 @@ if __name__ == "__main__":
     logging.info("Starting full pipeline execution")
     print("Starting pipeline execution...\n")
 
-    for script in scripts:
-        run_script(script)
-        # Stop early if a critical script fails
-        if results[-1][1] == "FAILED":
+    # Run the independent source chains concurrently (subprocesses, so threads suffice)
+    with ThreadPoolExecutor(max_workers=len(script_chains)) as pool:
+        failed = [script for script in pool.map(run_chain, script_chains) if script]
+
+    # Keep the summary in the original script order
+    results.sort(key=lambda result: scripts.index(result[0]))
+
+    # Stop if a critical script failed (its chain was already stopped there)
+    if failed:
+        for script in failed:
             print(f"{RED} Critical failure detected: {script}. Stopping pipeline.{RESET}")
-            sys.exit(1)
+        sys.exit(1)
 
     # Verify required files
     print("\n Verifying required files...\n")